@@ -8,22 +8,29 @@ specialized prompts for coordinated AI development workflows.
 
 import os
 
-try:
+__author__ = "Jeremiah K."
+__email__ = "jeremiahk@gmx.com"
+
+
+def __getattr__(name: str):
+    # Resolve __version__ on first access so `import agor` doesn't read
+    # package metadata; the result is cached as a module global
+    if name == "__version__":
+        global __version__
+        __version__ = _lookup_version()
+        return __version__
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _lookup_version() -> str:
     from importlib.metadata import PackageNotFoundError, version
-except ImportError:
-    # Fallback for Python < 3.8
-    from importlib_metadata import PackageNotFoundError, version
-
-# First try to get version from environment variable (GitHub tag)
-if "GITHUB_REF_NAME" in os.environ:
-    __version__ = os.environ.get("GITHUB_REF_NAME")
-else:
+
+    # First try to get version from environment variable (GitHub tag)
+    if "GITHUB_REF_NAME" in os.environ:
+        return os.environ.get("GITHUB_REF_NAME")
     # Fall back to package metadata using importlib.metadata (modern replacement for pkg_resources)
     try:
-        __version__ = version("agor")
+        return version("agor")
     except PackageNotFoundError:
         # If all else fails, use hardcoded version
-        __version__ = "0.6.3"
-
-__author__ = "Jeremiah K."
-__email__ = "jeremiahk@gmx.com"
+        return "0.6.3"
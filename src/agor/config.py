@@ -23,7 +23,7 @@ class AgorConfig:
         "main_only": False,
         "interactive": True,
         "assume_yes": False,
-        "shallow_depth": 5,
+        "shallow_depth": 1,
         "download_chunk_size": 1024,
         "progress_bar_width": 80,
         "git_binary_url": "https://github.com/nikvdp/1bin/releases/download/v0.0.40/git",
@@ -87,8 +87,9 @@ class AgorConfig:
         """Save current configuration to file."""
         self.config_dir.mkdir(parents=True, exist_ok=True)
         try:
-            with open(self.config_file, "w", encoding="utf-8") as f:
-                json.dump(self._config, f, indent=2)
+            self.config_file.write_text(
+                json.dumps(self._config, indent=2), encoding="utf-8"
+            )
         except OSError as e:
             print(f"❌ Error: Could not save config file {self.config_file}: {e}")
 
@@ -6,6 +6,8 @@ Mutable configuration values have been moved to settings.py.
 
 # File operations
 DOWNLOAD_CHUNK_SIZE = 1024  # 1 Kibibyte chunks for downloads
+TAR_COPY_BUFFER_SIZE = 2 * 1024 * 1024  # 2 MiB copy buffer (tarfile default is 16 KiB)
+SENDFILE_CHUNK_SIZE = 1 << 20  # 1 MiB per os.sendfile call
 PROGRESS_BAR_WIDTH = 80  # Consistent progress bar width
 
 # Compression formats
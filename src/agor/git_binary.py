@@ -11,7 +11,7 @@ import platformdirs
 
 from .config import config
 from .exceptions import GitBinaryError
-from .settings import settings
+from .settings import get_settings
 from .utils import download_file
 
 
@@ -75,12 +75,13 @@ class GitBinaryManager:
     def _try_download_binary(self) -> Optional[str]:
         """Try to download git binary."""
         try:
-            git_url = config.get("git_binary_url", settings.git_binary_url)
-            expected_hash = config.get("git_binary_sha256", settings.git_binary_sha256)
+            binaries = get_settings().binaries
+            git_url = config.get("git_binary_url", binaries.git_binary_url)
+            expected_hash = config.get("git_binary_sha256", binaries.git_binary_sha256)
 
             # Only verify hash if it's not the placeholder
             verify_hash = (
-                expected_hash if expected_hash != settings.git_binary_sha256 else None
+                expected_hash if expected_hash != binaries.git_binary_sha256 else None
             )
 
             download_file(git_url, self.cached_binary, verify_hash)
@@ -120,10 +121,11 @@ class GitBinaryManager:
 
     def _verify_binary_integrity(self, binary_path: Path) -> bool:
         """Verify binary integrity using SHA256."""
-        expected_hash = config.get("git_binary_sha256", settings.git_binary_sha256)
+        default_hash = get_settings().binaries.git_binary_sha256
+        expected_hash = config.get("git_binary_sha256", default_hash)
 
         # Skip verification if using placeholder hash
-        if expected_hash == settings.git_binary_sha256:
+        if expected_hash == default_hash:
             return True
 
         try:
@@ -1,23 +1,17 @@
 import os
-import re
-import shutil
-import subprocess
 import sys
-import tempfile
 from pathlib import Path
 from textwrap import dedent
-from typing import List, Optional
+from typing import Callable, List, Optional
 
-import platformdirs
 import typer
 
-from . import __version__
 from .config import config
 from .constants import (
     ARCHIVE_EXTENSIONS,
     SUCCESS_MESSAGES,
 )
-from .exceptions import ValidationError
+from .exceptions import NetworkError, ValidationError
 from .platform import (
     copy_to_clipboard,
     get_downloads_dir,
@@ -25,11 +19,21 @@ from .platform import (
     reveal_file_in_explorer,
 )
 from .repo_mgmt import clone_git_repo_to_temp_dir, get_clone_url, valid_git_repo
-from .settings import settings
+from .settings import AgorSettings, get_settings
 from .strategy import StrategyManager
-from .utils import create_archive, download_file, move_directory
+from .utils import (
+    create_archive,
+    download_file,
+    fast_copy_file,
+    move_directory,
+    replace_atomically,
+    write_stdout,
+)
 from .validation import validate_compression_format
 
+# Horizontal rule framing prompts and forms printed for copy/paste
+_RULE = "=" * 60
+
 app = typer.Typer(
     add_completion=False,
     help="🎼 AgentOrchestrator (AGOR) - Multi-Agent Development Coordination Platform",
@@ -178,6 +182,57 @@ branches_option = typer.Option(
 )
 
 
+def _fetch_git_binary(git_dest: Path, quiet_mode: bool) -> None:
+    """
+    Place the portable git binary at git_dest, downloading it into the user
+    cache first if needed.
+
+    Runs on a worker thread while bundle() clones the repository, so the
+    download draws no progress bar over the clone's output.
+    """
+    import platformdirs
+
+    git_url = config.get("git_binary_url", get_settings().binaries.git_binary_url)
+
+    # Use cache directory for git binary
+    git_cache_dir = Path(platformdirs.user_cache_dir("agor")) / "git_binary"
+    git_cache_dir.mkdir(parents=True, exist_ok=True)
+    git_binary_cache_path = git_cache_dir / "git"
+    git_etag_path = git_binary_cache_path.with_suffix(".etag")
+
+    if not git_binary_cache_path.exists():
+        if not quiet_mode:
+            print("📥 Downloading git binary...")
+        # Write the bundle's copy in the same read loop as the cache's
+        download_file(
+            git_url,
+            git_binary_cache_path,
+            etag_path=git_etag_path,
+            tee_path=git_dest,
+            show_progress=False,
+        )
+    elif git_etag_path.exists():
+        # Revalidate the cached binary; if it's unchanged (or the URL
+        # still serves the same file) this is a small 304 response
+        try:
+            download_file(
+                git_url,
+                git_binary_cache_path,
+                etag_path=git_etag_path,
+                tee_path=git_dest,
+                show_progress=False,
+            )
+        except NetworkError:
+            pass  # Offline or unreachable: the cached binary still works
+    git_binary_cache_path.chmod(0o755)
+
+    # Copy the cached git binary to the bundle unless the download already
+    # wrote it (hardlinked when the cache and temp dir share a filesystem)
+    if not git_dest.exists():
+        fast_copy_file(git_binary_cache_path, git_dest)
+    git_dest.chmod(0o755)
+
+
 @app.command()
 def bundle(
     src_repo: str = typer.Argument(
@@ -188,7 +243,13 @@ def bundle(
         None,
         "--format",
         "-f",
-        help=f"Archive format: {', '.join(ARCHIVE_EXTENSIONS.keys())} (default: {settings.compression_format})",
+        # Built without get_settings(): reading the environment and .env just
+        # to render help text would undo deferring settings to first use
+        help=(
+            f"Archive format: {', '.join(ARCHIVE_EXTENSIONS.keys())} "
+            "(default: the compression_format setting, "
+            f"{AgorSettings.model_fields['compression_format'].default} if unset)"
+        ),
     ),
     preserve_history: bool = typer.Option(
         None,
@@ -251,9 +312,14 @@ def bundle(
     Raises:
         Exits the CLI with an error if the repository, archive format, or prompt style is invalid, or if archive creation fails.
     """
+    # Deferred so commands that never bundle don't pay for these imports
+    import shutil
+    import tempfile
+    from concurrent.futures import ThreadPoolExecutor
+
     # Apply configuration defaults with CLI overrides
     compression_format = format or config.get(
-        "compression_format", settings.compression_format
+        "compression_format", get_settings().compression_format
     )
     preserve_hist = (
         preserve_history
@@ -268,6 +334,14 @@ def bundle(
     )
     auto_yes = assume_yes if assume_yes is not None else config.get("assume_yes", False)
     quiet_mode = quiet if quiet is not None else config.get("quiet", False)
+    # Decide once whether confirm prompts can be shown; with stdin piped or
+    # closed (scripts, CI) they'd block or fail, so use their defaults instead
+    can_prompt = (
+        is_interactive
+        and not auto_yes
+        and sys.stdin is not None
+        and sys.stdin.isatty()
+    )
 
     # Validate prompt style
     valid_prompt_styles = ["short", "long", "custom"]
@@ -285,79 +359,79 @@ def bundle(
 
     # Get repository information
     repo_name = get_clone_url(src_repo).split("/")[-1]
-    short_name = re.sub(r"\.git$", "", repo_name)
+    short_name = repo_name.removesuffix(".git")
 
     if not quiet_mode:
         print("🎼 AGOR Bundle Creation")
         print(f"📁 Repository: {repo_name}")
         print(f"📦 Format: {compression_format.upper()}")
 
-    # Process branches parameter if provided
-    branch_list = None
-    if branches:
-        branch_list = [b.strip() for b in branches if b.strip()]
-
-    # Determine which branches to clone
-    if main_branch_only:
-        if not quiet_mode:
-            print("📋 Bundling only main/master branch")
-        temp_repo = clone_git_repo_to_temp_dir(
-            src_repo, shallow=not preserve_hist, main_only=True
-        )
-    elif branch_list:
-        if not quiet_mode:
-            print(
-                f"📋 Bundling main/master plus additional branches: {', '.join(branch_list)}"
-            )
-        temp_repo = clone_git_repo_to_temp_dir(
-            src_repo, shallow=not preserve_hist, branches=branch_list
-        )
-    else:
-        if not quiet_mode:
-            print("📋 Bundling all branches from the repository (default)")
-        temp_repo = clone_git_repo_to_temp_dir(
-            src_repo, shallow=not preserve_hist, all_branches=True
-        )
-
-    if not quiet_mode:
-        print(f"⚙️  Preparing to build '{short_name}'...")
-
     # Create output directory structure
     output_dir = Path(tempfile.mkdtemp())
-    output_dir.mkdir(parents=True, exist_ok=True)
     tools_dir = Path(__file__).parent / "tools"
+    bundle_tools_dir = output_dir / "agor_tools"
+    bundle_tools_dir.mkdir()
+
+    # Fetch the git binary in the background while the repository is cloned;
+    # both wait on the network or a subprocess and don't depend on each other
+    executor = ThreadPoolExecutor(max_workers=1)
+    git_binary_future = executor.submit(
+        _fetch_git_binary, bundle_tools_dir / "git", quiet_mode
+    )
 
-    # Move the cloned repo into output_dir/project
-    project_dir = output_dir / "project"
-    move_directory(temp_repo, project_dir)
-
-    # Copy all files in tools to output_dir
-    shutil.copytree(tools_dir, output_dir / "agor_tools")
-
-    # Download and add git binary to bundle (simple approach that works)
     try:
-        git_url = config.get("git_binary_url", settings.git_binary_url)
+        # Process branches parameter if provided
+        branch_list = None
+        if branches:
+            branch_list = [b.strip() for b in branches if b.strip()]
 
-        # Use cache directory for git binary
-        git_cache_dir = Path(platformdirs.user_cache_dir("agor")) / "git_binary"
-        git_cache_dir.mkdir(parents=True, exist_ok=True)
-        git_binary_cache_path = git_cache_dir / "git"
-
-        # Download the git binary only if it doesn't exist in the cache
-        if not git_binary_cache_path.exists():
+        # Determine which branches to clone
+        if main_branch_only:
+            if not quiet_mode:
+                print("📋 Bundling only main/master branch")
+            temp_repo = clone_git_repo_to_temp_dir(
+                src_repo, shallow=not preserve_hist, main_only=True
+            )
+        elif branch_list:
+            if not quiet_mode:
+                print(
+                    f"📋 Bundling main/master plus additional branches: {', '.join(branch_list)}"
+                )
+            temp_repo = clone_git_repo_to_temp_dir(
+                src_repo, shallow=not preserve_hist, branches=branch_list
+            )
+        else:
             if not quiet_mode:
-                print("📥 Downloading git binary...")
-            download_file(git_url, git_binary_cache_path)
-            git_binary_cache_path.chmod(0o755)
+                print("📋 Bundling all branches from the repository (default)")
+            temp_repo = clone_git_repo_to_temp_dir(
+                src_repo, shallow=not preserve_hist, all_branches=True
+            )
 
-        # Copy the cached git binary to the bundle
-        git_dest = output_dir / "agor_tools" / "git"
-        shutil.copyfile(git_binary_cache_path, git_dest)
-        git_dest.chmod(0o755)
+        if not quiet_mode:
+            print(f"⚙️  Preparing to build '{short_name}'...")
+
+        # Move the cloned repo into output_dir/project
+        project_dir = output_dir / "project"
+        move_directory(temp_repo, project_dir)
+
+        # Copy all files in tools to output_dir. The tools are read-only package
+        # data and nothing below modifies them, so hardlinks/reflinks are safe
+        shutil.copytree(
+            tools_dir,
+            bundle_tools_dir,
+            copy_function=fast_copy_file,
+            dirs_exist_ok=True,
+        )
+    finally:
+        # Let the fetch finish even if the clone or copy fails, so it is never
+        # left writing into output_dir after bundle() has bailed out
+        executor.shutdown(wait=True)
 
+    # Report the background git binary fetch started before the clone
+    try:
+        git_binary_future.result()
         if not quiet_mode:
             print("📥 Added git binary to bundle")
-
     except Exception as e:
         if not quiet_mode:
             print(f"⚠️  Warning: Could not add git binary to bundle: {e}")
@@ -365,27 +439,10 @@ def bundle(
 
     # Create archive with the specified format
     archive_extension = ARCHIVE_EXTENSIONS[compression_format]
-    archive_path = Path(
-        tempfile.NamedTemporaryFile(delete=False, suffix=archive_extension).name
-    )
-
-    if not quiet_mode:
-        print(f"📦 Creating {compression_format.upper()} archive...")
 
-    try:
-        create_archive(output_dir, archive_path, compression_format)
-
-        # Verify archive contents for debugging
-        if not quiet_mode:
-            from .utils import verify_archive_contents
-
-            verify_archive_contents(archive_path)
-
-    except Exception as e:
-        print(f"❌ Failed to create archive: {e}")
-        raise typer.Exit(1) from e
-
-    # Determine where to save the bundled file
+    # Determine where to save the bundled file before building it, so the
+    # archive can be written next to its destination and renamed into place
+    # instead of being copied across filesystems from a temp directory
     final_filename = f"{short_name}{archive_extension}"
 
     if is_termux():
@@ -396,7 +453,7 @@ def bundle(
             print(f"📱 Running in Termux, saving to Downloads: {destination}")
     else:
         # For other platforms, ask the user where to save
-        if is_interactive and not auto_yes:
+        if can_prompt:
             # Ask if they want to save to current directory
             save_to_current = typer.confirm(
                 "Save the bundled file to the current directory?", default=True
@@ -425,8 +482,25 @@ def bundle(
             # In non-interactive mode, use current directory
             destination = Path.cwd() / final_filename
 
-    # Move the archive to the final destination
-    shutil.move(str(archive_path), str(destination))
+    if not quiet_mode:
+        print(f"📦 Creating {compression_format.upper()} archive...")
+
+    try:
+        # The part file is created exclusively, so concurrent bundles of the
+        # same repo can't write to the same file; it is renamed into place
+        # only once the archive is complete
+        with replace_atomically(destination, suffix=".part") as archive_path:
+            create_archive(output_dir, archive_path, compression_format)
+
+        # Verify archive contents for debugging
+        if not quiet_mode:
+            from .utils import verify_archive_contents
+
+            verify_archive_contents(destination)
+
+    except Exception as e:
+        print(f"❌ Failed to create archive: {e}")
+        raise typer.Exit(1) from e
 
     # Success message and prompt
     if not quiet_mode:
@@ -435,9 +509,9 @@ def bundle(
         print(f"📦 Format: {compression_format.upper()}")
         print(f"📏 Size: {destination.stat().st_size / 1024 / 1024:.1f} MB")
 
-        print("\n" + "=" * 60)
+        print(f"\n{_RULE}")
         print("🤖 AI ASSISTANT PROMPT")
-        print("=" * 60)
+        print(_RULE)
 
     # Generate AI prompt based on style
     if prompt_style == "short":
@@ -508,15 +582,14 @@ When asked, be prepared to create a PR summary, release notes, and or a handoff
 # <--- Add your specific project instructions below --->"""
 
     if not quiet_mode:
-        print(ai_prompt)
-        print("=" * 60)
+        write_stdout(f"{ai_prompt}\n{_RULE}\n")
 
     # Handle clipboard and file revelation
     if is_interactive:
         # Default to copying based on configuration
         should_copy = config.get("clipboard_copy_default", True)
 
-        if not auto_yes and not should_copy:
+        if can_prompt and not should_copy:
             should_copy = typer.confirm("Copy the AI prompt to clipboard?")
 
         if should_copy or auto_yes:
@@ -525,7 +598,7 @@ When asked, be prepared to create a PR summary, release notes, and or a handoff
                 print(f"\n{message}")
 
         # Offer to reveal file in system explorer (skip for Termux as it doesn't work)
-        if not auto_yes and not is_termux():
+        if can_prompt and not is_termux():
             reveal = typer.confirm("Open file location?")
             if reveal:
                 if reveal_file_in_explorer(destination):
@@ -544,6 +617,66 @@ When asked, be prepared to create a PR summary, release notes, and or a handoff
         )
 
 
+# Dedented once at import rather than on every custom_instructions call
+_CUSTOM_INSTRUCTIONS = dedent(
+    """
+    You are AgentOrchestrator (AGOR), a sophisticated AI assistant specializing in
+    multi-agent development coordination, project planning, and complex codebase management.
+    You coordinate teams of AI agents to execute large-scale development projects.
+
+    You have been provided with:
+    - a statically compiled `git` binary (in /tmp/agor_tools/git)
+    - the user's git repo (in the `/tmp/project` folder)
+    - advanced coordination tools and prompt templates
+
+    Before proceeding:
+    - **Always use the git binary provided in this folder for git operations**
+    - Configure `git` to make commits (use `git config` to set a name and
+      email of AgentOrchestrator and agor@example.local)
+
+    When working with the user, always:
+    - Use `git ls-files` to get the layout of the codebase at the start
+    - Use `git grep` when trying to find files in the codebase.
+    - Once you've found likely files, display them in their entirety.
+    - Make edits by targeting line ranges and rewriting the lines that differ.
+    - Always work proactively and autonomously. Do not ask for input from the user
+      unless you have fulfilled the user's request.
+    - Keep your code cells short, 1-2 lines of code so that you can see
+      where errors are. Do not write large chunks of code in one go.
+    - Always be persistent and creative. When in doubt, ask yourself 'how would a
+      proactive 10x engineer do this?', then do that.
+    - Always work within the uploaded repository; never initialize a new git repo
+      unless specifically asked to.
+    - Verify that your changes worked as intended by running `git diff`.
+    - Show a summary of the `git diff` output to the user and ask for
+      confirmation before committing.
+    - When analyzing the codebase, always work as far as possible without
+      asking the user for input. Give a brief summary of your status and
+      progress between each step, but do not go into detail until finished.
+
+    You are now a project planning and multi-agent coordination specialist. Your primary
+    functions include:
+
+    - Analyzing codebases and planning implementation strategies
+    - Designing multi-agent team structures for complex development projects
+    - Creating specialized prompts for different types of coding agents
+    - Coordinating workflows and snapshot procedures between agents
+    - Planning quality assurance and validation processes
+
+    When displaying results, choose the appropriate format:
+    - Full files: Complete files with all formatting preserved for copy/paste
+    - Changes only: Show just the modified sections with context
+    - Detailed analysis: Comprehensive explanation in a single codeblock for snapshot (replaces detailed snapshot)
+    - Agent prompts: Specialized prompts for coordinating multiple AI agents
+    - Project plans: Strategic breakdowns and coordination workflows
+
+    Show the comprehensive hotkey menu at the end of your replies with categories:
+    📊 Analysis & Display, 🎯 Strategic Planning, 👥 Agent Team Management,
+    📝 Prompt Engineering, 🔄 Coordination, and ⚙️ System commands.
+    """
+)
+
+
 @app.command()
 def custom_instructions(
     copy: bool = typer.Option(
@@ -554,67 +687,11 @@ def custom_instructions(
 ):
     """[AGENT] Generate custom instructions for AI assistants"""
 
-    instructions = dedent(
-        """
-        You are AgentOrchestrator (AGOR), a sophisticated AI assistant specializing in
-        multi-agent development coordination, project planning, and complex codebase management.
-        You coordinate teams of AI agents to execute large-scale development projects.
-
-        You have been provided with:
-        - a statically compiled `git` binary (in /tmp/agor_tools/git)
-        - the user's git repo (in the `/tmp/project` folder)
-        - advanced coordination tools and prompt templates
-
-        Before proceeding:
-        - **Always use the git binary provided in this folder for git operations**
-        - Configure `git` to make commits (use `git config` to set a name and
-          email of AgentOrchestrator and agor@example.local)
-
-        When working with the user, always:
-        - Use `git ls-files` to get the layout of the codebase at the start
-        - Use `git grep` when trying to find files in the codebase.
-        - Once you've found likely files, display them in their entirety.
-        - Make edits by targeting line ranges and rewriting the lines that differ.
-        - Always work proactively and autonomously. Do not ask for input from the user
-          unless you have fulfilled the user's request.
-        - Keep your code cells short, 1-2 lines of code so that you can see
-          where errors are. Do not write large chunks of code in one go.
-        - Always be persistent and creative. When in doubt, ask yourself 'how would a
-          proactive 10x engineer do this?', then do that.
-        - Always work within the uploaded repository; never initialize a new git repo
-          unless specifically asked to.
-        - Verify that your changes worked as intended by running `git diff`.
-        - Show a summary of the `git diff` output to the user and ask for
-          confirmation before committing.
-        - When analyzing the codebase, always work as far as possible without
-          asking the user for input. Give a brief summary of your status and
-          progress between each step, but do not go into detail until finished.
-
-        You are now a project planning and multi-agent coordination specialist. Your primary
-        functions include:
-
-        - Analyzing codebases and planning implementation strategies
-        - Designing multi-agent team structures for complex development projects
-        - Creating specialized prompts for different types of coding agents
-        - Coordinating workflows and snapshot procedures between agents
-        - Planning quality assurance and validation processes
-
-        When displaying results, choose the appropriate format:
-        - Full files: Complete files with all formatting preserved for copy/paste
-        - Changes only: Show just the modified sections with context
-        - Detailed analysis: Comprehensive explanation in a single codeblock for snapshot (replaces detailed snapshot)
-        - Agent prompts: Specialized prompts for coordinating multiple AI agents
-        - Project plans: Strategic breakdowns and coordination workflows
-
-        Show the comprehensive hotkey menu at the end of your replies with categories:
-        📊 Analysis & Display, 🎯 Strategic Planning, 👥 Agent Team Management,
-        📝 Prompt Engineering, 🔄 Coordination, and ⚙️ System commands.
-        """
-    )
+    instructions = _CUSTOM_INSTRUCTIONS
 
-    print("🤖 AGOR Custom Instructions for AI Assistants")
-    print("=" * 60)
-    print(instructions)
+    write_stdout(
+        f"🤖 AGOR Custom Instructions for AI Assistants\n{_RULE}\n{instructions}\n"
+    )
 
     if copy:
         success, message = copy_to_clipboard(instructions)
@@ -642,6 +719,7 @@ def git_config(
     show: bool = typer.Option(False, "--show", help="Show current git configuration"),
 ):
     """[CLI] Configure git user settings for AGOR development"""
+    import subprocess
 
     if show:
         print("🔍 Current Git Configuration:")
@@ -777,6 +855,7 @@ def generate_agor_feedback(
     from datetime import datetime
     from pathlib import Path
 
+    from . import __version__
     from .constants import PROTOCOL_VERSION
     from .platform import copy_to_clipboard
 
@@ -980,15 +1059,15 @@ def generate_agor_feedback(
         except subprocess.CalledProcessError as e:
             print(f"❌ Failed to commit feedback: {e}")
             print("\n📋 Feedback content (copy and save manually):")
-            print("=" * 60)
+            print(_RULE)
             print(feedback_content)
-            print("=" * 60)
+            print(_RULE)
     else:
         # Output as codeblock for copy/paste
         print("\n📋 AGOR Feedback Form (ready for copy/paste):")
-        print("=" * 60)
+        print(_RULE)
         print(feedback_content)
-        print("=" * 60)
+        print(_RULE)
 
         # Copy to clipboard if requested
         if copy:
@@ -1016,52 +1095,17 @@ def detick(
 
     If no content is given, reads from the clipboard, processes it, and updates the clipboard with the result. Optionally displays the processed content.
     """
-    try:
-        import pyperclip
-
-        from .tools.dev_tools import detick_content
-
-        # Get content from clipboard if not provided as argument
-        if content is None:
-            try:
-                content = pyperclip.paste()
-                if not content.strip():
-                    print(
-                        "❌ Clipboard is empty. Copy some content first or provide content as argument."
-                    )
-                    raise typer.Exit(1)
-                print("📋 Processing clipboard content...")
-            except Exception as e:
-                print(f"❌ Could not access clipboard: {e}")
-                print("💡 Provide content as argument: agor detick 'your content'")
-                raise typer.Exit(1) from e
-
-        # Process the content
-        processed = detick_content(content)
-
-        # Update clipboard with processed content
-        pyperclip.copy(processed)
-
-        # Show results
-        original_backticks = content.count("```")
-        processed_backticks = processed.count("``")
-
-        if show:
-            print("📝 Processed content:")
-            print("-" * 40)
-            print(processed)
-            print("-" * 40)
-
-        print(
-            f"✅ Deticked content updated in clipboard ({original_backticks} ``` → {processed_backticks} ``)"
-        )
-
-    except ImportError:
-        print("❌ pyperclip not available. Install with: pip install pyperclip")
-        raise typer.Exit(1) from None
-    except Exception as e:
-        print(f"❌ Error processing content: {e}")
-        raise typer.Exit(1) from e
+    from .tools.dev_tools import detick_content
+
+    _rewrite_backticks(
+        content,
+        show,
+        "detick",
+        detick_content,
+        "Deticked content updated in clipboard",
+        "```",
+        "``",
+    )
 
 
 @app.command()
@@ -1080,11 +1124,38 @@ def retick(
 
     If no content is given, reads from the clipboard, processes it, and writes the result back to the clipboard. Optionally displays the processed content.
     """
+    from .tools.dev_tools import retick_content
+
+    _rewrite_backticks(
+        content,
+        show,
+        "retick",
+        retick_content,
+        "Reticked content updated in clipboard",
+        "``",
+        "```",
+    )
+
+
+def _rewrite_backticks(
+    content: Optional[str],
+    show: bool,
+    command: str,
+    convert: Callable[[str], str],
+    done_message: str,
+    old_ticks: str,
+    new_ticks: str,
+) -> None:
+    """
+    Shared body of the detick and retick commands.
+
+    Converts content (or the clipboard when content is None) with convert,
+    copies the result to the clipboard, and reports how many backtick runs
+    were converted. command names the CLI command in the usage hint.
+    """
     try:
         import pyperclip
 
-        from .tools.dev_tools import retick_content
-
         # Get content from clipboard if not provided as argument
         if content is None:
             try:
@@ -1097,18 +1168,20 @@ def retick(
                 print("📋 Processing clipboard content...")
             except Exception as e:
                 print(f"❌ Could not access clipboard: {e}")
-                print("💡 Provide content as argument: agor retick 'your content'")
+                print(
+                    f"💡 Provide content as argument: agor {command} 'your content'"
+                )
                 raise typer.Exit(1) from e
 
         # Process the content
-        processed = retick_content(content)
+        processed = convert(content)
 
         # Update clipboard with processed content
         pyperclip.copy(processed)
 
         # Show results
-        original_backticks = content.count("``")
-        processed_backticks = processed.count("```")
+        original_backticks = content.count(old_ticks)
+        processed_backticks = processed.count(new_ticks)
 
         if show:
             print("📝 Processed content:")
@@ -1117,7 +1190,8 @@ def retick(
             print("-" * 40)
 
         print(
-            f"✅ Reticked content updated in clipboard ({original_backticks} `` → {processed_backticks} ```)"
+            f"✅ {done_message} "
+            f"({original_backticks} {old_ticks} → {processed_backticks} {new_ticks})"
         )
 
     except ImportError:
@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import List, Optional
 
 from agor.git_binary import git_manager
-from agor.settings import settings
+from agor.settings import get_settings
 
 
 class MemorySyncManager:
@@ -22,7 +22,7 @@ class MemorySyncManager:
         """
         self.repo_path = repo_path if repo_path else pathlib.Path().resolve()
         self.git_binary = git_manager.get_git_binary()
-        self.memory_file_relative_path = settings.memory_file
+        self.memory_file_relative_path = get_settings().memory_file
 
     def _run_git_command(self, command: List[str]) -> str:
         """
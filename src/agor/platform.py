@@ -2,21 +2,33 @@
 Platform detection and platform-specific utilities for AGOR.
 """
 
+import codecs
 import os
 import platform
 import shutil
 import subprocess
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 import platformdirs
 
 from .constants import TERMUX_INDICATORS
 
+# Memoized shutil.which, shared by every module that looks up an executable:
+# each lookup stats every $PATH entry, and the same names (git, pkg, the
+# clipboard and compressor commands) are probed repeatedly per process
+which = lru_cache(maxsize=None)(shutil.which)
 
+
+@lru_cache(maxsize=1)
 def is_termux() -> bool:
     """
     Check if running in Termux environment using multiple indicators.
 
+    The result is cached for the life of the process; the environment it
+    inspects doesn't change underneath a running CLI.
+
     Returns:
         True if running in Termux, False otherwise
     """
@@ -36,7 +48,7 @@ def is_termux() -> bool:
         return True
 
     # Check if termux-specific commands exist
-    if shutil.which("termux-info") or shutil.which("pkg"):
+    if which("termux-info") or which("pkg"):
         return True
 
     return False
@@ -57,10 +69,14 @@ def is_linux() -> bool:
     return platform.system() == "Linux" and not is_termux()
 
 
+@lru_cache(maxsize=1)
 def get_downloads_dir() -> str:
     """
     Get the Downloads directory path based on the platform.
 
+    Cached after the first call, which saves the stat probes when bundle()
+    asks for it again in interactive mode.
+
     Returns:
         Path to the Downloads directory
     """
@@ -91,135 +107,127 @@ def get_downloads_dir() -> str:
     return os.getcwd()
 
 
-def copy_to_clipboard(text: str) -> tuple[bool, str]:
-    """
-    Copy text to clipboard with platform-specific handling.
-
-    Args:
-        text: Text to copy to clipboard
-
-    Returns:
-        Tuple of (success: bool, message: str)
-    """
-    # First try pyperclip as it works on many platforms
+# Clipboard commands per platform, in order of preference, as
+# (label, argv, encoding). Every command reads the text to copy from stdin,
+# encoded as named; see _encode_clipboard_text().
+_CLIPBOARD_COMMANDS = {
+    "termux": (("termux-api", ("termux-clipboard-set",), "utf-8"),),
+    "windows": (
+        (
+            "PowerShell",
+            (
+                "powershell",
+                "-NoProfile",
+                "-Command",
+                # PowerShell 5.1 decodes stdin with the OEM code page unless
+                # told otherwise
+                "[Console]::InputEncoding=[Text.Encoding]::UTF8; "
+                "$input | Set-Clipboard",
+            ),
+            "utf-8",
+        ),
+        # clip.exe only recognises Unicode input when it starts with a BOM
+        ("clip.exe", ("clip",), "utf-16"),
+    ),
+    "macos": (("pbcopy", ("pbcopy",), "utf-8"),),
+    "linux": (
+        ("xclip", ("xclip", "-selection", "clipboard"), "utf-8"),
+        ("xsel", ("xsel", "--clipboard", "--input"), "utf-8"),
+        ("wl-copy", ("wl-copy",), "utf-8"),
+    ),
+}
+
+_CLIPBOARD_MISSING = {
+    "termux": "❌ termux-clipboard-set not found. Install with 'pkg install termux-api'",
+    "windows": "❌ No clipboard command found on Windows",
+    "macos": "❌ pbcopy not found on macOS",
+    "linux": "❌ No clipboard command found. Install xclip, xsel, or wl-clipboard",
+}
+
+
+def _clipboard_platform() -> Optional[str]:
+    """Return the _CLIPBOARD_COMMANDS key for the current platform."""
+    if is_termux():
+        return "termux"
+    elif is_windows():
+        return "windows"
+    elif is_macos():
+        return "macos"
+    elif is_linux():
+        return "linux"
+    return None
+
+
+@lru_cache(maxsize=1)
+def _load_pyperclip():
+    """Import pyperclip once, returning None when it isn't installed."""
     try:
         import pyperclip
+    except ImportError:
+        return None
+    return pyperclip
 
-        pyperclip.copy(text)
-        return True, "📋 Copied to clipboard!"
-    except Exception:
-        pass
 
-    # Platform-specific fallbacks
-    try:
-        if is_termux():
-            return _copy_termux(text)
-        elif is_windows():
-            return _copy_windows(text)
-        elif is_macos():
-            return _copy_macos(text)
-        elif is_linux():
-            return _copy_linux(text)
-        else:
-            return False, f"❌ Clipboard not supported on {platform.system()}"
-    except Exception as e:
-        return False, f"❌ Failed to copy to clipboard: {e}"
+def _encode_clipboard_text(text: str, encoding: str) -> bytes:
+    """Encode text for a clipboard command ("utf-16" means UTF-16LE with a BOM)."""
+    if encoding == "utf-16":
+        return codecs.BOM_UTF16_LE + text.encode("utf-16-le")
+    return text.encode(encoding)
 
 
-def _copy_termux(text: str) -> tuple[bool, str]:
-    """Copy to clipboard in Termux environment."""
-    try:
-        subprocess.run(
-            ["termux-clipboard-set"],
-            input=text.encode("utf-8"),
-            check=True,
-        )
-        return True, "📋 Copied to clipboard using termux-api!"
-    except subprocess.CalledProcessError as e:
-        return (
-            False,
-            f"❌ Failed to copy with termux-api: {e}. Install with 'pkg install termux-api'",
-        )
-    except FileNotFoundError:
-        return (
-            False,
-            "❌ termux-clipboard-set not found. Install with 'pkg install termux-api'",
-        )
-
-
-def _copy_windows(text: str) -> tuple[bool, str]:
-    """Copy to clipboard on Windows."""
-    # Try PowerShell first
-    try:
-        subprocess.run(
-            ["powershell", "-command", f"Set-Clipboard -Value '{text}'"],
-            check=True,
-            capture_output=True,
-        )
-        return True, "📋 Copied to clipboard using PowerShell!"
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        pass
+@lru_cache(maxsize=1)
+def _clipboard_commands() -> tuple[tuple[str, tuple[str, ...], str], ...]:
+    """
+    Resolve the installed clipboard commands for this platform.
 
-    # Try clip.exe
-    try:
-        subprocess.run(
-            ["clip"],
-            input=text.encode("utf-8"),
-            check=True,
-        )
-        return True, "📋 Copied to clipboard using clip.exe!"
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False, "❌ No clipboard command found on Windows"
+    Each candidate is looked up on PATH once per process, and resolved to
+    its absolute path so later runs skip the PATH search as well.
+    """
+    resolved = []
+    for label, argv, encoding in _CLIPBOARD_COMMANDS.get(_clipboard_platform(), ()):
+        executable = which(argv[0])
+        if executable:
+            resolved.append((label, (executable, *argv[1:]), encoding))
+    return tuple(resolved)
 
 
-def _copy_macos(text: str) -> tuple[bool, str]:
-    """Copy to clipboard on macOS."""
-    try:
-        subprocess.run("pbcopy", text=True, input=text, check=True)
-        return True, "📋 Copied to clipboard using pbcopy!"
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False, "❌ pbcopy not found on macOS"
+def copy_to_clipboard(text: str) -> tuple[bool, str]:
+    """
+    Copy text to clipboard with platform-specific handling.
 
+    Args:
+        text: Text to copy to clipboard
 
-def _copy_linux(text: str) -> tuple[bool, str]:
-    """Copy to clipboard on Linux."""
-    # Try xclip first
-    if shutil.which("xclip"):
+    Returns:
+        Tuple of (success: bool, message: str)
+    """
+    # First try pyperclip as it works on many platforms
+    pyperclip = _load_pyperclip()
+    if pyperclip is not None:
         try:
-            subprocess.run(
-                ["xclip", "-selection", "clipboard"],
-                input=text.encode("utf-8"),
-                check=True,
-            )
-            return True, "📋 Copied to clipboard using xclip!"
-        except subprocess.CalledProcessError:
+            pyperclip.copy(text)
+            return True, "📋 Copied to clipboard!"
+        except Exception:
             pass
 
-    # Try xsel
-    if shutil.which("xsel"):
-        try:
-            subprocess.run(
-                ["xsel", "--clipboard", "--input"],
-                input=text.encode("utf-8"),
-                check=True,
-            )
-            return True, "📋 Copied to clipboard using xsel!"
-        except subprocess.CalledProcessError:
-            pass
+    # Platform-specific fallbacks
+    platform_key = _clipboard_platform()
+    if platform_key is None:
+        return False, f"❌ Clipboard not supported on {platform.system()}"
 
-    # Try wl-copy (Wayland)
-    if shutil.which("wl-copy"):
+    errors = []
+    for label, argv, encoding in _clipboard_commands():
         try:
             subprocess.run(
-                ["wl-copy"],
-                input=text.encode("utf-8"),
-                check=True,
+                argv, input=_encode_clipboard_text(text, encoding), check=True
             )
-            return True, "📋 Copied to clipboard using wl-copy!"
-        except subprocess.CalledProcessError:
-            pass
+            return True, f"📋 Copied to clipboard using {label}!"
+        except (subprocess.CalledProcessError, OSError) as e:
+            errors.append(f"{label}: {e}")
 
-    return False, "❌ No clipboard command found. Install xclip, xsel, or wl-clipboard"
+    if errors:
+        return False, f"❌ Failed to copy to clipboard: {'; '.join(errors)}"
+    return False, _CLIPBOARD_MISSING[platform_key]
 
 
 def reveal_file_in_explorer(file_path: Path) -> bool:
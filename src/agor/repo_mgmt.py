@@ -6,10 +6,9 @@ import tempfile
 from pathlib import Path
 from urllib.parse import urlparse
 
-from plumbum.cmd import git
 from tqdm import tqdm
 
-from .settings import settings
+from .settings import get_settings
 
 
 def is_github_url(value: str) -> bool:
@@ -58,6 +57,17 @@ def get_clone_url(val: str) -> str:
         raise ValueError(f"'{val}' is not a valid GitHub URL.")
 
 
+def _shallow_clone_options() -> list:
+    """Return the `git clone` options for a shallow clone."""
+    settings = get_settings()
+    options = [f"--depth={settings.default_shallow_depth}", "--no-tags"]
+    if settings.default_single_branch:
+        options.append("--single-branch")
+    if settings.default_clone_filter:
+        options.append(f"--filter={settings.default_clone_filter}")
+    return options
+
+
 def clone_git_repo_to_temp_dir(
     git_repo: str,
     shallow: bool = True,
@@ -66,6 +76,8 @@ def clone_git_repo_to_temp_dir(
     branches: list = None,
     main_only: bool = False,
 ) -> Path:
+    from plumbum.cmd import git  # Deferred: importing plumbum walks $PATH
+
     is_local = True
     if is_github_url(git_repo):
         # Clone the repo to a temporary directory
@@ -90,7 +102,7 @@ def clone_git_repo_to_temp_dir(
     if main_only:
         # Clone only main/master branch
         if shallow:
-            clone_command.extend(["--depth", str(settings.default_shallow_depth)])
+            clone_command.extend(_shallow_clone_options())
         # Try to determine main/master branch
         if is_local:
             # For local repos, check what the default branch is
@@ -129,7 +141,11 @@ def clone_git_repo_to_temp_dir(
                 default_branch = "main"
 
         print(f"Cloning only main/master branch: {default_branch}")
+        # Say --single-branch explicitly so a full-history main-only clone
+        # doesn't fetch every other branch too
         clone_command.extend(["--branch", default_branch])
+        if "--single-branch" not in clone_command:
+            clone_command.append("--single-branch")
     elif branches and len(branches) > 0:
         # Clone main/master plus additional branches - use all branches approach for simplicity
         print(f"Cloning main/master plus additional branches: {branches}")
@@ -142,7 +158,7 @@ def clone_git_repo_to_temp_dir(
         clone_command.append("--bare")
     elif shallow:
         # Default behavior (current branch for local repos or default branch for remote repos)
-        clone_command.extend(["--depth", str(settings.default_shallow_depth)])
+        clone_command.extend(_shallow_clone_options())
         if is_local:
             checked_out_branch = git["rev-parse", "--abbrev-ref", "HEAD"](
                 cwd=local_repo.resolve()
@@ -352,6 +368,8 @@ def get_branches(repo_path: Path) -> list[str]:
     Returns:
         List of branch names
     """
+    from plumbum.cmd import git
+
     try:
         # Get all local branches
         result = git["branch", "-a"](cwd=repo_path)
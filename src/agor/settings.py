@@ -5,78 +5,86 @@ Replaces the old config.py globals with a proper settings object
 that can read from environment variables and config files.
 """
 
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Optional
 
-from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Shared by every settings model below
+_MODEL_CONFIG = SettingsConfigDict(
+    env_prefix="AGOR_",
+    env_file=".env",
+    env_file_encoding="utf-8",
+    case_sensitive=False,
+    frozen=True,
+    # AgorSettings and BinariesSettings share the AGOR_ prefix and .env file,
+    # so each must ignore the other's keys
+    extra="ignore",
+)
+
+
+class BinariesSettings(BaseSettings):
+    """Portable binary download settings, only loaded when a binary is fetched."""
+
+    model_config = _MODEL_CONFIG
+
+    # Plain defaults: none of these need aliases or validators, so skip
+    # building Field() objects at import time
+
+    # URL to download portable git binary
+    git_binary_url: str = "https://github.com/nikvdp/1bin/releases/download/v0.0.40/git"
+    # SHA256 hash for git binary verification
+    git_binary_sha256: str = (
+        "af17911884c5afcf5be1c2438483e8d65a82c6a80ed8a354b8d4f6e0b964978f"
+    )
+
 
 class AgorSettings(BaseSettings):
     """AGOR configuration settings with environment variable support."""
 
-    model_config = SettingsConfigDict(
-        env_prefix="AGOR_",
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-    )
+    model_config = _MODEL_CONFIG
 
     # Git operations
-    default_shallow_depth: int = Field(
-        default=100, description="Default depth for shallow git clones"
-    )
-    git_binary_url: str = Field(
-        default="https://github.com/nikvdp/1bin/releases/download/v0.0.40/git",
-        description="URL to download portable git binary",
-    )
-    git_binary_sha256: str = Field(
-        default="af17911884c5afcf5be1c2438483e8d65a82c6a80ed8a354b8d4f6e0b964978f",
-        description="SHA256 hash for git binary verification",
-    )
+    default_shallow_depth: int = 1  # Default depth for shallow git clones
+    default_single_branch: bool = True  # Shallow clones fetch only one branch
+    default_clone_filter: Optional[str] = None  # Partial clone filter, e.g. blob:none
 
     # Bundle creation
-    compression_format: str = Field(
-        default="zip", description="Default compression format for bundles"
-    )
-    preserve_history: bool = Field(
-        default=True, description="Whether to preserve full git history in bundles"
-    )
-    main_only: bool = Field(
-        default=False,
-        description="Whether to bundle only main/master branch by default",
-    )
+    compression_format: str = "zip"  # Default compression format for bundles
+    preserve_history: bool = True  # Preserve full git history in bundles
+    main_only: bool = False  # Bundle only main/master branch by default
 
     # Memory management
-    memory_file: str = Field(
-        default=".agor/memory.md",
-        description="Path to memory file relative to project root",
-    )
+    memory_file: str = ".agor/memory.md"  # Relative to project root
 
     # User interface
-    interactive: bool = Field(
-        default=True, description="Whether to show interactive prompts"
-    )
-    assume_yes: bool = Field(
-        default=False, description="Whether to assume yes for all prompts"
-    )
-    clipboard_copy_default: bool = Field(
-        default=True, description="Whether to copy prompts to clipboard by default"
-    )
+    interactive: bool = True  # Show interactive prompts
+    assume_yes: bool = False  # Assume yes for all prompts
+    clipboard_copy_default: bool = True  # Copy prompts to clipboard by default
 
     # Logging
-    log_level: str = Field(
-        default="INFO", description="Logging level (DEBUG, INFO, WARNING, ERROR)"
-    )
+    log_level: str = "INFO"  # DEBUG, INFO, WARNING, ERROR
 
     # Paths
-    config_dir: Optional[Path] = Field(
-        default=None, description="Custom configuration directory"
-    )
-    cache_dir: Optional[Path] = Field(
-        default=None, description="Custom cache directory"
-    )
+    config_dir: Optional[Path] = None  # Custom configuration directory
+    cache_dir: Optional[Path] = None  # Custom cache directory
+
+    @cached_property
+    def binaries(self) -> BinariesSettings:
+        """Binary download settings (AGOR_GIT_BINARY_*), read on first access."""
+        return BinariesSettings()
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> AgorSettings:
+    """Return the global settings instance, built on first use."""
+    return AgorSettings()
 
 
-# Global settings instance
-settings = AgorSettings()
+def __getattr__(name: str):
+    # Keep `from agor.settings import settings` working without reading the
+    # environment and .env at import time
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
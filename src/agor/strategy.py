@@ -6,7 +6,9 @@ development strategies including Parallel Divergent, Pipeline, Swarm, etc.
 """
 
 import json
+import os
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -16,6 +18,12 @@ from agor.tools.git_operations import run_git_command
 
 from .memory_sync import MemorySyncManager
 
+# Spaces and underscores both become dashes in agent branch task slugs
+_TASK_SLUG_TABLE = str.maketrans({" ": "-", "_": "-"})
+
+# Source file extensions counted when sizing up a project
+_SOURCE_SUFFIXES = (".py", ".js", ".ts", ".java", ".go")
+
 
 class StrategyManager:
     """Manages multi-agent development strategies and coordination state."""
@@ -25,7 +33,13 @@ class StrategyManager:
         self.project_root = project_root or Path.cwd()
         self.agor_dir = self.project_root / ".agor"
         self.state_dir = self.agor_dir / "state"
-        self.memory_manager = MemorySyncManager(self.project_root)
+
+    @cached_property
+    def memory_manager(self) -> MemorySyncManager:
+        """Memory sync manager, created on first use."""
+        # Construction resolves the git binary, which most strategy commands
+        # (status, suggestions, agent updates) never need
+        return MemorySyncManager(self.project_root)
 
     def init_coordination(self, task: str, agents: int = 3) -> None:
         """Initialize .agor/ directory and coordination files."""
@@ -149,17 +163,14 @@ class StrategyManager:
         print("🧠 Analyzing project for strategy recommendation...")
         print("=" * 50)
 
-        # Basic project analysis
-        project_files = (
-            list(self.project_root.glob("**/*.py"))
-            + list(self.project_root.glob("**/*.js"))
-            + list(self.project_root.glob("**/*.ts"))
-            + list(self.project_root.glob("**/*.java"))
-            + list(self.project_root.glob("**/*.go"))
+        # Basic project analysis: one walk of the tree counts every source
+        # type, rather than a separate recursive glob (and list) per extension
+        file_count = sum(
+            name.endswith(_SOURCE_SUFFIXES)
+            for _dirpath, _dirnames, filenames in os.walk(self.project_root)
+            for name in filenames
         )
 
-        file_count = len(project_files)
-
         print(f"📁 Project files: {file_count}")
         print(f"🔧 Complexity: {complexity}")
         print(f"👥 Team size: {team_size}")
@@ -226,7 +237,7 @@ class StrategyManager:
     def _create_agent_branches(self, task: str, agents: int) -> Dict[str, str]:
         """Create git branches for each agent."""
         agent_branches = {}
-        task_slug = task.lower().replace(" ", "-").replace("_", "-")[:20]
+        task_slug = task.lower().translate(_TASK_SLUG_TABLE)[:20]
 
         for i in range(1, agents + 1):
             agent_id = f"agent{i}"
@@ -264,17 +275,20 @@ class StrategyManager:
             "status": "initialized",
         }
 
-        with open(self.state_dir / "strategy.json", "w") as f:
-            json.dump(strategy_data, f, indent=2)
+        (self.state_dir / "strategy.json").write_text(
+            json.dumps(strategy_data, indent=2)
+        )
 
         # Agent branches mapping
-        with open(self.state_dir / "agent_branches.json", "w") as f:
-            json.dump(agent_branches, f, indent=2)
+        (self.state_dir / "agent_branches.json").write_text(
+            json.dumps(agent_branches, indent=2)
+        )
 
         # Active tasks status
         active_tasks = {agent: "pending" for agent in agent_branches.keys()}
-        with open(self.state_dir / "active_tasks.json", "w") as f:
-            json.dump(active_tasks, f, indent=2)
+        (self.state_dir / "active_tasks.json").write_text(
+            json.dumps(active_tasks, indent=2)
+        )
 
         # Parallel Divergent evaluation template
         pd_eval_content = f"""# Parallel Divergent Evaluation
@@ -438,14 +452,23 @@ You are working **independently** with {agents-1} other agents on the same probl
                 return
 
             old_status = tasks[agent_id]
+            if old_status == status:
+                # Nothing to write, log or re-check
+                print(f"ℹ️ {agent_id} status is already {status}")
+                return
             tasks[agent_id] = status
 
-            with open(tasks_file, "w") as f:
-                json.dump(tasks, f, indent=2)
+            tasks_file.write_text(json.dumps(tasks, indent=2))
+
+            # Counted once and handed to both helpers rather than each
+            # re-reading the tasks file
+            completed_count = sum(
+                1 for agent_status in tasks.values() if agent_status == "completed"
+            )
 
             # Update sync flags if agent completed
             if status == "completed" and old_status != "completed":
-                self._update_completion_count()
+                self._update_completion_count(completed_count)
 
             # Log the status change
             self._log_event(f"Agent {agent_id} status: {old_status} → {status}")
@@ -453,23 +476,15 @@ You are working **independently** with {agents-1} other agents on the same probl
             print(f"✅ Updated {agent_id} status: {old_status} → {status}")
 
             # Check if all agents are ready for merge
-            self._check_merge_readiness()
+            self._check_merge_readiness(completed_count, len(tasks))
         else:
             print("❌ No active tasks file found")
 
-    def _update_completion_count(self) -> None:
+    def _update_completion_count(self, completed_count: int) -> None:
         """Update the count of completed agents in sync flags."""
-        tasks_file = self.state_dir / "active_tasks.json"
         sync_file = self.state_dir / "sync_flags.yaml"
 
-        if tasks_file.exists() and sync_file.exists():
-            with open(tasks_file) as f:
-                tasks = json.load(f)
-
-            completed_count = sum(
-                1 for status in tasks.values() if status == "completed"
-            )
-
+        if sync_file.exists():
             with open(sync_file) as f:
                 sync_data = yaml.safe_load(f) or {}
 
@@ -479,23 +494,14 @@ You are working **independently** with {agents-1} other agents on the same probl
             with open(sync_file, "w") as f:
                 yaml.dump(sync_data, f, default_flow_style=False)
 
-    def _check_merge_readiness(self) -> None:
+    def _check_merge_readiness(self, completed_count: int, total_agents: int) -> None:
         """Check if all agents are ready for merge phase."""
-        tasks_file = self.state_dir / "active_tasks.json"
         sync_file = self.state_dir / "sync_flags.yaml"
 
-        if tasks_file.exists() and sync_file.exists():
-            with open(tasks_file) as f:
-                tasks = json.load(f)
-
+        if sync_file.exists():
             with open(sync_file) as f:
                 sync_data = yaml.safe_load(f) or {}
 
-            completed_count = sum(
-                1 for status in tasks.values() if status == "completed"
-            )
-            total_agents = len(tasks)
-
             if completed_count == total_agents:
                 sync_data["pd_merge_pending"] = True
 
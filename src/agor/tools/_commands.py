@@ -5,18 +5,29 @@ This module contains the command handlers for the AGOR wrapper CLI tool.
 Extracted to reduce cyclomatic complexity in the main wrapper script.
 """
 
-from typing import Any, Callable, Dict
-
-from agor.tools.external_integration import get_agor_tools
+from typing import Any
 
 
 class CommandHandlers:
     """Command handlers for AGOR wrapper CLI."""
 
+    # No instance __dict__, so the tools are cached in a slot rather than
+    # through functools.cached_property
+    __slots__ = ("args", "_tools")
+
     def __init__(self, args: Any):
         """Initialize command handlers with parsed arguments."""
         self.args = args
-        self.tools = get_agor_tools()
+        self._tools = None
+
+    @property
+    def tools(self):
+        """AGOR tools, loaded only once a handler needs them."""
+        if self._tools is None:
+            from agor.tools.external_integration import get_agor_tools
+
+            self._tools = get_agor_tools()
+        return self._tools
 
     def handle_status(self) -> int:
         """Handle status command."""
@@ -60,21 +71,10 @@ class CommandHandlers:
             print(f"❌ Failed to commit: {self.args.message}")
         return 0 if success else 1
 
-    def get_dispatch_table(self) -> Dict[str, Callable[[], int]]:
-        """Get the command dispatch table."""
-        return {
-            "status": self.handle_status,
-            "test": self.handle_test,
-            "pr": self.handle_pr,
-            "handoff": self.handle_handoff,
-            "snapshot": self.handle_snapshot,
-            "commit": self.handle_commit,
-        }
-
 
 def execute_command(args: Any) -> int:
     """
-    Execute a command using the dispatch table.
+    Execute a command by calling its handler.
 
     Args:
         args: Parsed command line arguments
@@ -84,14 +84,22 @@ def execute_command(args: Any) -> int:
     """
     try:
         handlers = CommandHandlers(args)
-        dispatch_table = handlers.get_dispatch_table()
-
-        handler = dispatch_table.get(args.command)
-        if handler:
-            return handler()
-
-        print(f"❌ Unknown command: {args.command}")
-        return 1
+        match args.command:
+            case "status":
+                return handlers.handle_status()
+            case "test":
+                return handlers.handle_test()
+            case "pr":
+                return handlers.handle_pr()
+            case "handoff":
+                return handlers.handle_handoff()
+            case "snapshot":
+                return handlers.handle_snapshot()
+            case "commit":
+                return handlers.handle_commit()
+            case _:
+                print(f"❌ Unknown command: {args.command}")
+                return 1
 
     except Exception as e:
         print(f"❌ Error executing command '{args.command}': {e}")
@@ -3,37 +3,76 @@ Agent Prompt Templates for Multi-Agent Coordination
 
 This module contains template functions for generating specialized prompts
 for different types of coding agents in a multi-agent development environment.
+
+The role prompts (specialist, snapshot, validation, integration, coordinator
+and context) are laid out with their static guidance first and the per-call
+details last. Each ``_*_PREFIX`` constant is therefore an identical leading
+block across calls and can be used as a prompt-cache breakpoint by callers
+whose LLM provider supports prefix caching (e.g. an Anthropic
+``cache_control={"type": "ephemeral"}`` block ending after the prefix).
+
+Each role prompt is built from a tuple of parts. ``generate_*`` joins the
+parts into one string, while ``iter_*`` yields them in order so callers that
+write to a socket or file can stream the prompt without materializing it.
+
+Convention: prompt text is assembled with ``"".join(parts)``, never with ``+``
+between strings (enforced for all ``*_templates.py`` modules by
+tests/test_prompt_templates.py).
 """
 
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Optional
 
-def generate_specialist_prompt(role, context, task, snapshot_requirements):
-    """Generate a focused prompt for a specialist agent"""
-    return f"""
-You are a {role} specialist in a coordinated development team.
+# Prompts are assembled with str.join over their parts rather than with
+# string.Template: on multi-KB inputs Template.substitute was about twice as
+# slow as str.format, and join is cheaper still.
 
-CONTEXT: {context}
-TASK: {task}
+# Sections shared by several role prompts
+_DELIVER_HEADING = "\nDELIVER:\n"
+_CONTEXT_HEADING = "\n\nCONTEXT:\n"
 
-DELIVERABLES:
-{snapshot_requirements}
+_SPECIALIST_PREFIX = """
+You are a specialist in a coordinated development team.
 
 FORMAT:
 - Complete working code with comments
 - List dependencies for other agents
 - Flag any issues outside your specialty
 
-Focus on {role} best practices and seamless team integration.
+Focus on the best practices of your specialty and seamless team integration.
 """
 
 
-def generate_snapshot_prompt(from_agent, to_agent, work_completed, next_tasks, context):
-    """Generate a snapshot prompt for agent-to-agent transitions"""
-    return f"""
-AGENT SNAPSHOT: {from_agent} → {to_agent}
+def _specialist_parts(role, context, task, snapshot_requirements):
+    return (
+        _SPECIALIST_PREFIX,
+        "\nROLE: ",
+        str(role),
+        " specialist\nCONTEXT: ",
+        str(context),
+        "\nTASK: ",
+        str(task),
+        "\n\nDELIVERABLES:\n",
+        str(snapshot_requirements),
+        "\n",
+    )
+
 
+def generate_specialist_prompt(role, context, task, snapshot_requirements):
+    """Generate a focused prompt for a specialist agent"""
+    return "".join(_specialist_parts(role, context, task, snapshot_requirements))
+
+
+def iter_specialist_prompt(role, context, task, snapshot_requirements):
+    """Yield the specialist prompt in chunks (see generate_specialist_prompt)"""
+    yield from _specialist_parts(role, context, task, snapshot_requirements)
+
+
+_SNAPSHOT_PREFIX = """
 SETUP REQUIREMENTS:
 # Install dependencies for memory manager types
-pip install pydantic pydantic-settings || {{
+pip install pydantic pydantic-settings || {
     echo "⚠️ pip install failed, trying .pyenv venv fallback"
     if [ -d ".pyenv" ]; then
         source .pyenv/bin/activate
@@ -44,16 +83,7 @@ pip install pydantic pydantic-settings || {{
         source .pyenv/bin/activate
         pip install pydantic pydantic-settings
     fi
-}}
-
-COMPLETED WORK:
-{work_completed}
-
-YOUR TASKS:
-{next_tasks}
-
-CONTEXT:
-{context}
+}
 
 REQUIREMENTS:
 - Review all provided materials first
@@ -65,89 +95,226 @@ ACKNOWLEDGE: Confirm receipt and report any issues immediately.
 """
 
 
-def generate_validation_prompt(code_to_review, validation_criteria, context):
-    """Generate a prompt for code review and validation agents"""
-    return f"""
-You are a Code Validation Agent.
+def _snapshot_parts(from_agent, to_agent, work_completed, next_tasks, context):
+    return (
+        _SNAPSHOT_PREFIX,
+        "\nAGENT SNAPSHOT: ",
+        str(from_agent),
+        " → ",
+        str(to_agent),
+        "\n\nCOMPLETED WORK:\n",
+        str(work_completed),
+        "\n\nYOUR TASKS:\n",
+        str(next_tasks),
+        _CONTEXT_HEADING,
+        str(context),
+        "\n",
+    )
 
-CODE TO REVIEW:
-{code_to_review}
 
-CRITERIA:
-{validation_criteria}
+def generate_snapshot_prompt(from_agent, to_agent, work_completed, next_tasks, context):
+    """Generate a snapshot prompt for agent-to-agent transitions"""
+    return "".join(
+        _snapshot_parts(from_agent, to_agent, work_completed, next_tasks, context)
+    )
 
-CONTEXT:
-{context}
 
+def iter_snapshot_prompt(from_agent, to_agent, work_completed, next_tasks, context):
+    """Yield the snapshot prompt in chunks (see generate_snapshot_prompt)"""
+    yield from _snapshot_parts(
+        from_agent, to_agent, work_completed, next_tasks, context
+    )
+
+
+_VALIDATION_ROLE = "\nYou are a Code Validation Agent.\n"
+
+_VALIDATION_PREFIX = "".join(
+    (
+        _VALIDATION_ROLE,
+        """
 CHECK:
 - Code quality and standards compliance
 - Functional correctness and requirements
 - Security vulnerabilities
 - Performance considerations
-
-DELIVER:
-- Review report with specific findings
+""",
+        _DELIVER_HEADING,
+        """- Review report with specific findings
 - Required fixes with explanations
 - Status: APPROVED / NEEDS_REVISION / REJECTED
-"""
+""",
+    )
+)
+
+_VALIDATION_TERSE_PREFIX = "".join(
+    (
+        _VALIDATION_ROLE,
+        "Apply the CHECK and DELIVER guidance from earlier in this session.\n",
+    )
+)
+
+
+def _validation_parts(code_to_review, validation_criteria, context, verbose):
+    return (
+        _VALIDATION_PREFIX if verbose else _VALIDATION_TERSE_PREFIX,
+        "\nCODE TO REVIEW:\n",
+        str(code_to_review),
+        "\n\nCRITERIA:\n",
+        str(validation_criteria),
+        _CONTEXT_HEADING,
+        str(context),
+        "\n",
+    )
+
+
+def generate_validation_prompt(
+    code_to_review, validation_criteria, context, verbose=True
+):
+    """Generate a prompt for code review and validation agents
 
+    Pass ``verbose=False`` on follow-up turns where the agent already has the
+    CHECK/DELIVER guidance in context; only the per-call details are sent.
+    """
+    return "".join(
+        _validation_parts(code_to_review, validation_criteria, context, verbose)
+    )
 
-def generate_integration_prompt(components, integration_requirements, context):
-    """Generate a prompt for system integration agents"""
-    return f"""
-You are a System Integration Agent.
 
-COMPONENTS:
-{components}
+def iter_validation_prompt(code_to_review, validation_criteria, context, verbose=True):
+    """Yield the validation prompt in chunks (see generate_validation_prompt)"""
+    yield from _validation_parts(code_to_review, validation_criteria, context, verbose)
 
-REQUIREMENTS:
-{integration_requirements}
 
-CONTEXT:
-{context}
+_INTEGRATION_ROLE = "\nYou are a System Integration Agent.\n"
 
+_INTEGRATION_PREFIX = "".join(
+    (
+        _INTEGRATION_ROLE,
+        """
 TASKS:
 - Verify component compatibility and interfaces
 - Design and implement integration tests
 - Ensure proper data flow and communication
 - Validate deployment readiness
-
-DELIVER:
-- Integration test suite
+""",
+        _DELIVER_HEADING,
+        """- Integration test suite
 - Deployment configuration
 - Performance benchmarks
 - Go/no-go recommendation
-"""
+""",
+    )
+)
+
+_INTEGRATION_TERSE_PREFIX = "".join(
+    (
+        _INTEGRATION_ROLE,
+        "Apply the TASKS and DELIVER guidance from earlier in this session.\n",
+    )
+)
+
+
+def _integration_parts(components, integration_requirements, context, verbose):
+    return (
+        _INTEGRATION_PREFIX if verbose else _INTEGRATION_TERSE_PREFIX,
+        "\nCOMPONENTS:\n",
+        str(components),
+        "\n\nREQUIREMENTS:\n",
+        str(integration_requirements),
+        _CONTEXT_HEADING,
+        str(context),
+        "\n",
+    )
+
+
+def generate_integration_prompt(
+    components, integration_requirements, context, verbose=True
+):
+    """Generate a prompt for system integration agents
 
+    Pass ``verbose=False`` on follow-up turns where the agent already has the
+    TASKS/DELIVER guidance in context; only the per-call details are sent.
+    """
+    return "".join(
+        _integration_parts(components, integration_requirements, context, verbose)
+    )
 
-def generate_project_coordinator_prompt(
-    project_overview, team_structure, current_phase
-):
-    """Generate a prompt for project coordination agents"""
-    return f"""
-You are a Project Coordination Agent.
 
-PROJECT:
-{project_overview}
+def iter_integration_prompt(
+    components, integration_requirements, context, verbose=True
+):
+    """Yield the integration prompt in chunks (see generate_integration_prompt)"""
+    yield from _integration_parts(
+        components, integration_requirements, context, verbose
+    )
 
-TEAM:
-{team_structure}
 
-PHASE:
-{current_phase}
+_PROJECT_COORDINATOR_ROLE = "\nYou are a Project Coordination Agent.\n"
 
+_PROJECT_COORDINATOR_PREFIX = "".join(
+    (
+        _PROJECT_COORDINATOR_ROLE,
+        """
 RESPONSIBILITIES:
 - Monitor team progress and resolve blockers
 - Coordinate snapshots and synchronization
 - Ensure quality standards and code reviews
 - Manage risks and timeline
-
-DELIVER:
-- Status reports and progress updates
+""",
+        _DELIVER_HEADING,
+        """- Status reports and progress updates
 - Risk assessment and mitigation plans
 - Process improvements
 - Final project summary
-"""
+""",
+    )
+)
+
+_PROJECT_COORDINATOR_TERSE_PREFIX = "".join(
+    (
+        _PROJECT_COORDINATOR_ROLE,
+        "Apply the RESPONSIBILITIES and DELIVER guidance from earlier in this session.\n",
+    )
+)
+
+
+def _project_coordinator_parts(
+    project_overview, team_structure, current_phase, verbose
+):
+    return (
+        _PROJECT_COORDINATOR_PREFIX if verbose else _PROJECT_COORDINATOR_TERSE_PREFIX,
+        "\nPROJECT:\n",
+        str(project_overview),
+        "\n\nTEAM:\n",
+        str(team_structure),
+        "\n\nPHASE:\n",
+        str(current_phase),
+        "\n",
+    )
+
+
+def generate_project_coordinator_prompt(
+    project_overview, team_structure, current_phase, verbose=True
+):
+    """Generate a prompt for project coordination agents
+
+    Pass ``verbose=False`` on follow-up turns where the agent already has the
+    RESPONSIBILITIES/DELIVER guidance in context.
+    """
+    return "".join(
+        _project_coordinator_parts(
+            project_overview, team_structure, current_phase, verbose
+        )
+    )
+
+
+def iter_project_coordinator_prompt(
+    project_overview, team_structure, current_phase, verbose=True
+):
+    """Yield the project coordinator prompt in chunks"""
+    yield from _project_coordinator_parts(
+        project_overview, team_structure, current_phase, verbose
+    )
 
 
 def generate_strategy_selection_prompt(project_complexity, team_size, timeline):
@@ -194,6 +361,7 @@ Based on the project context, recommend the optimal strategy and explain why.
 
 def generate_parallel_divergent_prompt(agent_id, mission, branch_name, total_agents):
     """Generate a prompt for parallel divergent strategy agents"""
+    memory_file = f".agor/{agent_id.lower()}-memory.md"
     return f"""
 AGENT: {agent_id}
 BRANCH: {branch_name}
@@ -203,9 +371,9 @@ MISSION:
 {mission}
 
 COORDINATION PROTOCOL:
-1. **Read First**: Check `.agor/agentconvo.md` and `.agor/{agent_id.lower()}-memory.md`
+1. **Read First**: Check `.agor/agentconvo.md` and `{memory_file}`
 2. **Communicate**: Post status updates to `.agor/agentconvo.md`
-3. **Document**: Update `.agor/{agent_id.lower()}-memory.md` with decisions and progress
+3. **Document**: Update `{memory_file}` with decisions and progress
 4. **Sync Often**: Pull from main branch frequently to stay current
 5. **Stay Independent**: Work on YOUR solution approach without coordinating
 
@@ -231,7 +399,7 @@ MEMORY FILE UPDATES:
 
 DELIVERABLES:
 - Working implementation on {branch_name}
-- Complete memory log in `.agor/{agent_id.lower()}-memory.md`
+- Complete memory log in `{memory_file}`
 - Communication entries in `.agor/agentconvo.md`
 - Design rationale and known limitations
 
@@ -319,18 +487,7 @@ Format: [AGENT-ID] [TIMESTAMP] - [STATUS/QUESTION/FINDING]
 """
 
 
-def generate_context_prompt(codebase_analysis, project_goals, constraints):
-    """Generate a context-rich prompt that includes codebase knowledge"""
-    return f"""
-CODEBASE:
-{codebase_analysis}
-
-GOALS:
-{project_goals}
-
-CONSTRAINTS:
-{constraints}
-
+_CONTEXT_PREFIX = """
 GUIDELINES:
 - Follow existing patterns and conventions
 - Respect API contracts and interfaces
@@ -339,6 +496,253 @@ GUIDELINES:
 """
 
 
+def _context_parts(codebase_analysis, project_goals, constraints):
+    return (
+        _CONTEXT_PREFIX,
+        "\nCODEBASE:\n",
+        str(codebase_analysis),
+        "\n\nGOALS:\n",
+        str(project_goals),
+        "\n\nCONSTRAINTS:\n",
+        str(constraints),
+        "\n",
+    )
+
+
+@lru_cache(maxsize=64)
+def _render_context_prompt(codebase_analysis, project_goals, constraints):
+    return "".join(_context_parts(codebase_analysis, project_goals, constraints))
+
+
+def generate_context_prompt(codebase_analysis, project_goals, constraints):
+    """Generate a context-rich prompt that includes codebase knowledge
+
+    The context prompt is shared by every agent prompt in a session, so
+    renders are memoized on the (stringified) inputs. Call
+    ``clear_context_prompt_cache()`` after the codebase changes.
+    """
+    return _render_context_prompt(
+        str(codebase_analysis), str(project_goals), str(constraints)
+    )
+
+
+def clear_context_prompt_cache():
+    """Forget memoized context prompts (see generate_context_prompt)"""
+    _render_context_prompt.cache_clear()
+
+
+def iter_context_prompt(codebase_analysis, project_goals, constraints):
+    """Yield the context prompt in chunks (see generate_context_prompt)"""
+    yield from _context_parts(codebase_analysis, project_goals, constraints)
+
+
+# UTF-8 ENCODED VARIANTS
+#
+# For prompts headed straight into an HTTP body. The static prefixes are
+# encoded once at import, so only the per-call parts are encoded per call.
+
+_ENCODED_PREFIXES = {
+    prefix: prefix.encode("utf-8")
+    for prefix in (
+        _SPECIALIST_PREFIX,
+        _SNAPSHOT_PREFIX,
+        _VALIDATION_PREFIX,
+        _VALIDATION_TERSE_PREFIX,
+        _INTEGRATION_PREFIX,
+        _INTEGRATION_TERSE_PREFIX,
+        _PROJECT_COORDINATOR_PREFIX,
+        _PROJECT_COORDINATOR_TERSE_PREFIX,
+        _CONTEXT_PREFIX,
+    )
+}
+
+
+def _encode_parts(parts):
+    prefix, *rest = parts
+    return b"".join(
+        (_ENCODED_PREFIXES[prefix], *(part.encode("utf-8") for part in rest))
+    )
+
+
+def generate_specialist_prompt_bytes(role, context, task, snapshot_requirements):
+    """UTF-8 encoded generate_specialist_prompt"""
+    return _encode_parts(_specialist_parts(role, context, task, snapshot_requirements))
+
+
+def generate_snapshot_prompt_bytes(
+    from_agent, to_agent, work_completed, next_tasks, context
+):
+    """UTF-8 encoded generate_snapshot_prompt"""
+    return _encode_parts(
+        _snapshot_parts(from_agent, to_agent, work_completed, next_tasks, context)
+    )
+
+
+def generate_validation_prompt_bytes(
+    code_to_review, validation_criteria, context, verbose=True
+):
+    """UTF-8 encoded generate_validation_prompt"""
+    return _encode_parts(
+        _validation_parts(code_to_review, validation_criteria, context, verbose)
+    )
+
+
+def generate_integration_prompt_bytes(
+    components, integration_requirements, context, verbose=True
+):
+    """UTF-8 encoded generate_integration_prompt"""
+    return _encode_parts(
+        _integration_parts(components, integration_requirements, context, verbose)
+    )
+
+
+def generate_project_coordinator_prompt_bytes(
+    project_overview, team_structure, current_phase, verbose=True
+):
+    """UTF-8 encoded generate_project_coordinator_prompt"""
+    return _encode_parts(
+        _project_coordinator_parts(
+            project_overview, team_structure, current_phase, verbose
+        )
+    )
+
+
+def generate_context_prompt_bytes(codebase_analysis, project_goals, constraints):
+    """UTF-8 encoded generate_context_prompt"""
+    return _encode_parts(_context_parts(codebase_analysis, project_goals, constraints))
+
+
+# PROMPT SPECS
+#
+# Frozen, slotted value objects for callers that keep prompt inputs around
+# (retry loops, checkpointed coordinator state). Each spec renders its prompt
+# at most once; ``rendered`` returns the same string on every access.
+
+
+class _PromptSpec:
+    """Shared render-once behaviour for the prompt spec dataclasses"""
+
+    __slots__ = ()
+
+    @property
+    def rendered(self) -> str:
+        if self._rendered is None:
+            object.__setattr__(self, "_rendered", "".join(self._parts()))
+        return self._rendered
+
+
+@dataclass(frozen=True, slots=True)
+class SpecialistPromptSpec(_PromptSpec):
+    """Inputs for generate_specialist_prompt"""
+
+    role: str
+    context: str
+    task: str
+    snapshot_requirements: str
+    _rendered: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _parts(self):
+        return _specialist_parts(
+            self.role, self.context, self.task, self.snapshot_requirements
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class SnapshotPromptSpec(_PromptSpec):
+    """Inputs for generate_snapshot_prompt"""
+
+    from_agent: str
+    to_agent: str
+    work_completed: str
+    next_tasks: str
+    context: str
+    _rendered: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _parts(self):
+        return _snapshot_parts(
+            self.from_agent,
+            self.to_agent,
+            self.work_completed,
+            self.next_tasks,
+            self.context,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ValidationPromptSpec(_PromptSpec):
+    """Inputs for generate_validation_prompt"""
+
+    code_to_review: str
+    validation_criteria: str
+    context: str
+    verbose: bool = True
+    _rendered: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _parts(self):
+        return _validation_parts(
+            self.code_to_review, self.validation_criteria, self.context, self.verbose
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class IntegrationPromptSpec(_PromptSpec):
+    """Inputs for generate_integration_prompt"""
+
+    components: str
+    integration_requirements: str
+    context: str
+    verbose: bool = True
+    _rendered: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _parts(self):
+        return _integration_parts(
+            self.components, self.integration_requirements, self.context, self.verbose
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectCoordinatorPromptSpec(_PromptSpec):
+    """Inputs for generate_project_coordinator_prompt"""
+
+    project_overview: str
+    team_structure: str
+    current_phase: str
+    verbose: bool = True
+    _rendered: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _parts(self):
+        return _project_coordinator_parts(
+            self.project_overview, self.team_structure, self.current_phase, self.verbose
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ContextPromptSpec(_PromptSpec):
+    """Inputs for generate_context_prompt"""
+
+    codebase_analysis: str
+    project_goals: str
+    constraints: str
+    _rendered: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _parts(self):
+        return _context_parts(
+            self.codebase_analysis, self.project_goals, self.constraints
+        )
+
+
 # DETAILED EXAMPLES FOR AGENT COORDINATION
 
 
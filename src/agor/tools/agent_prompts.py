@@ -22,6 +22,55 @@ except ImportError:
     FEEDBACK_MANAGER_AVAILABLE = False
 
 
+# Static sections shared by the agent handoff prompts here and in snapshots.py.
+# Defined once so every handoff prompt is assembled from the same constants
+# rather than each function re-embedding its own copy of the text.
+HANDOFF_INITIALIZATION_DOCS = """
+## AGOR Initialization
+Read these files to understand the system:
+- src/agor/tools/README_ai.md (role selection and initialization)
+- src/agor/tools/AGOR_INSTRUCTIONS.md (operational guide)
+- src/agor/tools/index.md (documentation index)
+"""
+
+HANDOFF_MEMORY_ACCESS_TEMPLATE = """
+## Memory Branch Access
+Your coordination files are stored on memory branch: {memory_branch}
+
+Access previous work context:
+```bash
+# View memory branch contents
+git show {memory_branch}:.agor/
+git show {memory_branch}:.agor/snapshots/
+```
+"""
+
+HANDOFF_ROLE_OPTIONS = """\
+- Worker Agent: Code analysis, implementation, technical work
+- Project Coordinator: Planning and multi-agent coordination
+"""
+
+HANDOFF_GETTING_STARTED = """
+## Getting Started
+1. Initialize your environment using the setup commands above
+2. Read the AGOR documentation files
+3. Select your role based on the task requirements
+4. Review any previous work context provided
+5. Begin work following AGOR protocols
+
+Remember: Always create a snapshot before ending your session using the dev tools.
+
+---
+*This handoff prompt was generated automatically with environment detection and backtick processing*
+"""
+
+
+# Backtick runs rewritten by detick_content()/retick_content(). Lookarounds
+# keep longer runs intact to avoid runaway replacements.
+_TRIPLE_BACKTICK_RE = re.compile(r"(?<!`)```(?!`)")
+_DOUBLE_BACKTICK_RE = re.compile(r"(?<!`)``(?!`)")
+
+
 def get_current_branch() -> str:
     """Get current git branch name."""
     success, branch = run_git_command(["branch", "--show-current"])
@@ -53,10 +102,8 @@ def detick_content(content: str) -> str:
     Returns:
         Content with triple backticks converted to double backticks
     """
-    # Use regex to avoid runaway replacements
     # Only replace ``` that are not preceded or followed by another backtick
-    pattern = r"(?<!`)```(?!`)"
-    return re.sub(pattern, "``", content)
+    return _TRIPLE_BACKTICK_RE.sub("``", content)
 
 
 def retick_content(content: str) -> str:
@@ -72,10 +119,8 @@ def retick_content(content: str) -> str:
     Returns:
         Content with double backticks converted to triple backticks
     """
-    # Use regex to avoid runaway replacements
     # Only replace `` that are not preceded or followed by another backtick
-    pattern = r"(?<!`)``(?!`)"
-    return re.sub(pattern, "```", content)
+    return _DOUBLE_BACKTICK_RE.sub("```", content)
 
 
 def _format_feedback_list(items: List[str], empty_message: str) -> str:
@@ -89,6 +134,34 @@ def _format_feedback_list(items: List[str], empty_message: str) -> str:
     return "\n".join(f"- {item}" for item in items)
 
 
+# Allowed values checked by validate_feedback_input, built once at import
+FEEDBACK_TYPES = (
+    "bug",
+    "enhancement",
+    "workflow_issue",
+    "success_story",
+    "documentation",
+    "performance",
+    "usability",
+)
+FEEDBACK_SEVERITIES = ("low", "medium", "high", "critical")
+FEEDBACK_COMPONENTS = (
+    "dev_tools",
+    "memory_system",
+    "hotkeys",
+    "coordination",
+    "documentation",
+    "git_operations",
+    "agent_prompts",
+    "snapshots",
+    "environment_detection",
+    "workflow",
+    "user_interface",
+    "performance",
+    "general",
+)
+
+
 def validate_feedback_input(
     feedback_type: str,
     feedback_content: str,
@@ -110,26 +183,18 @@ def validate_feedback_input(
     }
 
     # Validate feedback type
-    valid_types = [
-        "bug",
-        "enhancement",
-        "workflow_issue",
-        "success_story",
-        "documentation",
-        "performance",
-        "usability",
-    ]
-    if feedback_type not in valid_types:
+    if feedback_type not in FEEDBACK_TYPES:
         validation["issues"].append(f"Invalid feedback type: {feedback_type}")
-        validation["suggestions"].append(f"Use one of: {', '.join(valid_types)}")
+        validation["suggestions"].append(f"Use one of: {', '.join(FEEDBACK_TYPES)}")
         validation["normalized_type"] = "general"
         validation["is_valid"] = False
 
     # Validate severity
-    valid_severities = ["low", "medium", "high", "critical"]
-    if severity not in valid_severities:
+    if severity not in FEEDBACK_SEVERITIES:
         validation["issues"].append(f"Invalid severity: {severity}")
-        validation["suggestions"].append(f"Use one of: {', '.join(valid_severities)}")
+        validation["suggestions"].append(
+            f"Use one of: {', '.join(FEEDBACK_SEVERITIES)}"
+        )
         validation["normalized_severity"] = "medium"
         validation["is_valid"] = False
 
@@ -148,25 +213,9 @@ def validate_feedback_input(
         )
 
     # Validate component
-    common_components = [
-        "dev_tools",
-        "memory_system",
-        "hotkeys",
-        "coordination",
-        "documentation",
-        "git_operations",
-        "agent_prompts",
-        "snapshots",
-        "environment_detection",
-        "workflow",
-        "user_interface",
-        "performance",
-        "general",
-    ]
-
-    if component not in common_components:
+    if component not in FEEDBACK_COMPONENTS:
         validation["suggestions"].append(
-            f"Consider using a standard component: {', '.join(common_components[:5])}..."
+            f"Consider using a standard component: {', '.join(FEEDBACK_COMPONENTS[:5])}..."
         )
 
     # Content quality suggestions
@@ -181,6 +230,25 @@ def validate_feedback_input(
     return validation
 
 
+# GitHub labels for feedback types and severities in create_github_issue_content()
+_ISSUE_TYPE_LABELS = {
+    "bug": "bug",
+    "enhancement": "enhancement",
+    "workflow_issue": "workflow",
+    "success_story": "feedback",
+    "documentation": "documentation",
+    "performance": "performance",
+    "usability": "UX",
+}
+
+_ISSUE_SEVERITY_LABELS = {
+    "low": "priority: low",
+    "medium": "priority: medium",
+    "high": "priority: high",
+    "critical": "priority: critical",
+}
+
+
 @dataclass
 class GitHubIssueConfig:
     """Configuration for GitHub issue creation."""
@@ -206,24 +274,6 @@ def create_github_issue_content(config: GitHubIssueConfig) -> str:
     if config.reproduction_steps is None:
         config.reproduction_steps = []
 
-    # Map feedback types to GitHub labels
-    type_labels = {
-        "bug": "bug",
-        "enhancement": "enhancement",
-        "workflow_issue": "workflow",
-        "success_story": "feedback",
-        "documentation": "documentation",
-        "performance": "performance",
-        "usability": "UX",
-    }
-
-    severity_labels = {
-        "low": "priority: low",
-        "medium": "priority: medium",
-        "high": "priority: high",
-        "critical": "priority: critical",
-    }
-
     issue_content = f"""## {config.feedback_type.replace('_', ' ').title()}
 
 **Component**: {config.component}
@@ -264,8 +314,8 @@ def create_github_issue_content(config: GitHubIssueConfig) -> str:
 
     # Add labels section
     labels = [
-        type_labels.get(config.feedback_type, "feedback"),
-        severity_labels.get(config.severity, "priority: medium"),
+        _ISSUE_TYPE_LABELS.get(config.feedback_type, "feedback"),
+        _ISSUE_SEVERITY_LABELS.get(config.severity, "priority: medium"),
     ]
     if config.component != "general":
         labels.append(f"component: {config.component}")
@@ -759,6 +809,7 @@ def generate_agent_handoff_prompt_extended(
     memory_branch: str = None,
     environment: dict = None,
     brief_context: str = None,
+    role_options: str = HANDOFF_ROLE_OPTIONS,
 ) -> str:
     """
     Generate a comprehensive agent handoff prompt containing environment details, task overview, setup instructions, memory branch access, and optional context for seamless agent transitions.
@@ -769,6 +820,7 @@ def generate_agent_handoff_prompt_extended(
         memory_branch (str, optional): Name of the memory branch for coordination.
         environment (dict, optional): Environment details; auto-detected if not provided.
         brief_context (str, optional): Brief background for quick orientation.
+        role_options (str, optional): Bulleted role menu shown under "Select appropriate role".
     
     Returns:
         str: A formatted prompt string, processed to avoid codeblock rendering issues, ready for use in a single codeblock.
@@ -782,83 +834,48 @@ def generate_agent_handoff_prompt_extended(
 
     timestamp = get_current_timestamp()
 
-    # Start building the prompt
-    prompt = f"""# 🤖 AGOR Agent Handoff
+    # Collect sections and join once rather than growing a string per section
+    parts = [
+        f"""# 🤖 AGOR Agent Handoff
 
 **Generated**: {timestamp}
 **Environment**: {environment.get('mode', 'unknown')} ({environment.get('platform', 'unknown')})
 **AGOR Version**: {environment.get('agor_version', 'unknown')}
 """
+    ]
 
     # Add memory branch information if available
     if memory_branch:
-        prompt += f"""**Memory Branch**: {memory_branch}
-"""
+        parts.append(f"**Memory Branch**: {memory_branch}\n")
 
-    prompt += f"""
-## Task Overview
-{task_description}
-"""
+    parts.append(f"\n## Task Overview\n{task_description}\n")
 
     # Add brief context if provided
     if brief_context:
-        prompt += f"""
-## Quick Context
-{brief_context}
-"""
+        parts.append(f"\n## Quick Context\n{brief_context}\n")
 
     # Add environment-specific setup
     from agor.tools.dev_testing import get_agent_dependency_install_commands
 
-    prompt += f"""
+    parts.append(
+        f"""
 ## Environment Setup
 {get_agent_dependency_install_commands()}
-
-## AGOR Initialization
-Read these files to understand the system:
-- src/agor/tools/README_ai.md (role selection and initialization)
-- src/agor/tools/AGOR_INSTRUCTIONS.md (operational guide)
-- src/agor/tools/index.md (documentation index)
-
+{HANDOFF_INITIALIZATION_DOCS}
 Select appropriate role:
-- Worker Agent: Code analysis, implementation, technical work
-- Project Coordinator: Planning and multi-agent coordination
-"""
+{role_options}"""
+    )
 
     # Add memory branch access if applicable
     if memory_branch:
-        prompt += f"""
-## Memory Branch Access
-Your coordination files are stored on memory branch: {memory_branch}
-
-Access previous work context:
-```bash
-# View memory branch contents
-git show {memory_branch}:.agor/
-git show {memory_branch}:.agor/snapshots/
-```
-"""
+        parts.append(HANDOFF_MEMORY_ACCESS_TEMPLATE.format(memory_branch=memory_branch))
 
     # Add snapshot content if provided
     if snapshot_content:
-        prompt += f"""
-## Previous Work Context
-{snapshot_content}
-"""
+        parts.append(f"\n## Previous Work Context\n{snapshot_content}\n")
 
-    prompt += """
-## Getting Started
-1. Initialize your environment using the setup commands above
-2. Read the AGOR documentation files
-3. Select your role based on the task requirements
-4. Review any previous work context provided
-5. Begin work following AGOR protocols
-
-Remember: Always create a snapshot before ending your session using the dev tools.
-
----
-*This handoff prompt was generated automatically with environment detection and backtick processing*
-"""
+    parts.append(HANDOFF_GETTING_STARTED)
+    prompt = "".join(parts)
 
     # Apply backtick processing to prevent formatting issues
     processed_prompt = detick_content(prompt)
@@ -21,6 +21,24 @@ import sys
 from pathlib import Path
 
 
+def _add_source_dir_to_path():
+    """Put the source tree containing this script on sys.path."""
+    try:
+        # Try to get the src directory (2 levels up from this file)
+        script_path = Path(__file__).resolve()
+        if len(script_path.parents) > 2:
+            current_dir = script_path.parents[2]  # …/src
+        else:
+            # Fallback: use the directory containing this script
+            current_dir = script_path.parent
+    except (IndexError, OSError):
+        # Fallback: use current working directory
+        current_dir = Path.cwd()
+
+    if current_dir.is_dir() and str(current_dir) not in sys.path:
+        sys.path.insert(0, str(current_dir))
+
+
 def main():
     """Main wrapper function with command-line interface."""
     parser = argparse.ArgumentParser(
@@ -68,21 +86,10 @@ def main():
 
     # Initialize AGOR tools
     try:
-        # Add current directory to path for development environment
-        try:
-            # Try to get the src directory (2 levels up from this file)
-            script_path = Path(__file__).resolve()
-            if len(script_path.parents) > 2:
-                current_dir = script_path.parents[2]  # …/src
-            else:
-                # Fallback: use the directory containing this script
-                current_dir = script_path.parent
-        except (IndexError, OSError):
-            # Fallback: use current working directory
-            current_dir = Path.cwd()
-
-        if current_dir.is_dir() and str(current_dir) not in sys.path:
-            sys.path.insert(0, str(current_dir))
+        # Add current directory to path for development environment; skipped
+        # when the package is already loaded (e.g. main() called in-process)
+        if "agor" not in sys.modules:
+            _add_source_dir_to_path()
 
         from agor.tools._commands import execute_command
 
@@ -7,31 +7,14 @@ utilities for AGOR development workflows.
 All functions use absolute imports for better reliability.
 """
 
+from functools import lru_cache
 from typing import Dict, List
 
 # Use absolute imports to prevent E0402 errors
 from agor.tools.git_operations import get_current_timestamp, run_git_command
 
-
-def generate_development_checklist(task_type: str = "general") -> str:
-    """
-    Generates a formatted development checklist string for a specified task type.
-    
-    The checklist covers pre-development, development, testing, documentation, and completion steps, and appends additional items for "feature", "bugfix", or "refactor" tasks. A generation timestamp is included.
-    
-    Args:
-        task_type: The type of development task ("general", "feature", "bugfix", or "refactor").
-    
-    Returns:
-        A formatted checklist string tailored to the specified task type.
-    """
-    timestamp = get_current_timestamp()
-
-    base_checklist = f"""# 📋 Development Checklist - {task_type.title()}
-
-**Generated**: {timestamp}
-**Task Type**: {task_type}
-
+# Static checklist sections, built once at import rather than on every call
+_BASE_CHECKLIST_SECTIONS = """\
 ## 🚀 Pre-Development
 - [ ] Read AGOR documentation and select appropriate role
 - [ ] Understand task requirements and scope
@@ -64,33 +47,60 @@ def generate_development_checklist(task_type: str = "general") -> str:
 - [ ] Update project status and coordination files
 """
 
-    # Add task-specific items
-    if task_type == "feature":
-        base_checklist += """
+_TASK_SPECIFIC_SECTIONS = {
+    "feature": """
 ## 🆕 Feature-Specific
 - [ ] Feature meets acceptance criteria
 - [ ] Integration with existing features tested
 - [ ] Performance impact assessed
 - [ ] User experience considerations addressed
-"""
-    elif task_type == "bugfix":
-        base_checklist += """
+""",
+    "bugfix": """
 ## 🐛 Bugfix-Specific
 - [ ] Root cause identified and documented
 - [ ] Fix addresses the core issue
 - [ ] Regression tests added
 - [ ] Similar issues checked and addressed
-"""
-    elif task_type == "refactor":
-        base_checklist += """
+""",
+    "refactor": """
 ## 🔄 Refactor-Specific
 - [ ] Functionality preserved (no behavior changes)
 - [ ] Code quality and maintainability improved
 - [ ] Performance impact assessed
 - [ ] All tests still pass
-"""
+""",
+}
 
-    return base_checklist
+
+@lru_cache(maxsize=8)
+def _checklist_sections(task_type: str) -> str:
+    """Return the static checklist body for a task type, joined once per type."""
+    return _BASE_CHECKLIST_SECTIONS + _TASK_SPECIFIC_SECTIONS.get(task_type, "")
+
+
+def generate_development_checklist(task_type: str = "general") -> str:
+    """
+    Generates a formatted development checklist string for a specified task type.
+    
+    The checklist covers pre-development, development, testing, documentation, and completion steps, and appends additional items for "feature", "bugfix", or "refactor" tasks. A generation timestamp is included.
+    
+    Args:
+        task_type: The type of development task ("general", "feature", "bugfix", or "refactor").
+    
+    Returns:
+        A formatted checklist string tailored to the specified task type.
+    """
+    timestamp = get_current_timestamp()
+
+    return (
+        f"""# 📋 Development Checklist - {task_type.title()}
+
+**Generated**: {timestamp}
+**Task Type**: {task_type}
+
+"""
+        + _checklist_sections(task_type)
+    )
 
 
 def create_agent_transition_checklist() -> str:
@@ -1,6 +1,79 @@
+import io
+import mmap
 import os
 import re
-from typing import List, Optional, Tuple
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+# Characters that make a grep() pattern more than a plain substring
+_REGEX_METACHARS = frozenset(".^$*+?{}[]\\|()")
+
+# Below this size a plain read() is cheaper than setting up an mmap
+_MMAP_MIN_SIZE = 64 * 1024
+
+# Signature patterns per language used by find_function_signatures()
+_SIGNATURE_PATTERNS = {
+    "javascript": [
+        r"function\s+[a-zA-Z_$][\w$]*\s*\(",  # Named function
+        r"\bfunction\s*\(",  # Anonymous function
+        r"[a-zA-Z_$][\w$]*\s*=\s*function\s*\(",  # Function assigned to a variable
+        r"[a-zA-Z_$][\w$]*\s*=\s*\([^)]*\)\s*=>",  # Arrow function assigned to a variable
+        r"[a-zA-Z_$][\w$]*\s*:\s*function\s*\(",  # Method in an object literal (named function)
+        r"[a-zA-Z_$][\w$]*\s*:\s*\([^)]*\)\s*=>",  # Method in an object literal (arrow function)
+        r"export\s+function\s+[a-zA-Z_$][\w$]*\(",  # Named exported function
+        r"export\s+default\s+function\s*[a-zA-Z_$][\w$]*\s*\(",  # Default exported function (named)
+        r"export\s+default\s+function\s*\(",  # Default exported function (anonymous)
+        r"class\s+[a-zA-Z_$][\w$]*",  # Class definitions
+        r"[a-zA-Z_$][\w$]*\s*\([^)]*\)\s*{",  # Method definitions
+    ],
+    "typescript": [
+        r"function\s+[a-zA-Z_$][\w$]*\s*\(",
+        r"[a-zA-Z_$][\w$]*\s*=\s*\([^)]*\)\s*=>",
+        r"class\s+[a-zA-Z_$][\w$]*",
+        r"interface\s+[a-zA-Z_$][\w$]*",
+        r"type\s+[a-zA-Z_$][\w$]*\s*=",
+    ],
+    "python": [
+        r"def\s+[a-zA-Z_][\w]*\s*\(",  # Function definitions
+        r"class\s+[a-zA-Z_][\w]*",  # Class definitions
+        r"async\s+def\s+[a-zA-Z_][\w]*\s*\(",  # Async function definitions
+    ],
+    "c": [r"\w+\s+[a-zA-Z_][\w]*\s*\([^)]*\)\s*{"],  # Function definitions
+    "cpp": [
+        r"\w+\s+[a-zA-Z_][\w]*\s*\([^)]*\)\s*{",  # Function definitions
+        r"class\s+[a-zA-Z_][\w]*",  # Class definitions
+        r"struct\s+[a-zA-Z_][\w]*",  # Struct definitions
+    ],
+    "java": [
+        r"\w+\s+[a-zA-Z_][\w]*\s*\([^)]*\)\s*{",  # Method definitions
+        r"class\s+[a-zA-Z_][\w]*",  # Class definitions
+        r"interface\s+[a-zA-Z_][\w]*",  # Interface definitions
+    ],
+    "ruby": [
+        r"def\s+[a-zA-Z_][\w]*",  # Method definitions
+        r"class\s+[a-zA-Z_][\w]*",  # Class definitions
+        r"module\s+[a-zA-Z_][\w]*",  # Module definitions
+    ],
+    "go": [
+        r"func\s+[a-zA-Z_][\w]*\s*\(",  # Function definitions
+        r"type\s+[a-zA-Z_][\w]*\s+struct",  # Struct definitions
+        r"type\s+[a-zA-Z_][\w]*\s+interface",  # Interface definitions
+    ],
+    "rust": [
+        r"fn\s+[a-zA-Z_][\w]*\s*\(",  # Function definitions
+        r"struct\s+[a-zA-Z_][\w]*",  # Struct definitions
+        r"enum\s+[a-zA-Z_][\w]*",  # Enum definitions
+        r"trait\s+[a-zA-Z_][\w]*",  # Trait definitions
+    ],
+}
+
+# Each language's patterns joined into one alternation, compiled once, so a
+# line is scanned a single time instead of once per pattern
+_SIGNATURE_REGEXES = {
+    language: re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
+    for language, patterns in _SIGNATURE_PATTERNS.items()
+}
 
 
 def bfs_find(base: str, pattern: str) -> List[str]:
@@ -16,21 +89,22 @@ def bfs_find(base: str, pattern: str) -> List[str]:
     if not os.path.exists(base):
         return []
 
-    queue = [base]
+    regex = re.compile(pattern)
+    queue = deque([base])
     matched_files = []
 
     while queue:
-        current_path = queue.pop(0)
+        current_path = queue.popleft()
         try:
-            if os.path.isdir(current_path):
-                for entry in os.listdir(current_path):
-                    full_path = os.path.join(current_path, entry)
-                    if os.path.isdir(full_path):
-                        queue.append(full_path)
-                    elif re.search(pattern, entry):
-                        matched_files.append(full_path)
+            # scandir entries carry their type, so no extra stat per entry
+            with os.scandir(current_path) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        queue.append(entry.path)
+                    elif regex.search(entry.name):
+                        matched_files.append(entry.path)
         except (PermissionError, OSError):
-            # Skip directories we can't read
+            # Skip directories we can't read (or a base that is a file)
             continue
 
     return matched_files
@@ -54,23 +128,94 @@ def grep(
     if not os.path.exists(file_path):
         return matches
 
+    if pattern and _REGEX_METACHARS.isdisjoint(pattern):
+        # A plain substring: match lines with str containment instead of the
+        # regex engine, and skip files without it on one bytes scan
+        def search(line: str) -> bool:
+            return pattern in line
+
+        needle = pattern.encode("utf-8")
+    else:
+        # Compile once up front rather than per line
+        search = re.compile(pattern).search
+        needle = None
+
     if os.path.isdir(file_path) and recursive:
-        for root, _, files in os.walk(file_path):
-            for file in files:
-                matches.extend(grep(os.path.join(root, file), pattern))
+        # Files are independent, so read and scan them on a thread pool;
+        # map() keeps the results in walk order
+        def grep_one(path: str) -> List[Tuple[str, int, str]]:
+            file_matches: List[Tuple[str, int, str]] = []
+            _grep_file(path, search, file_matches, needle)
+            return file_matches
+
+        with ThreadPoolExecutor() as executor:
+            for file_matches in executor.map(grep_one, _walk_files(file_path)):
+                matches.extend(file_matches)
     elif os.path.isfile(file_path):
-        try:
-            with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                for line_no, line in enumerate(f, start=1):
-                    if re.search(pattern, line):
-                        matches.append((file_path, line_no, line.strip()))
-        except (PermissionError, OSError):
-            # Skip files we can't read
-            pass
+        _grep_file(file_path, search, matches, needle)
 
     return matches
 
 
+def _walk_files(directory: str) -> Iterator[str]:
+    """Yield file paths under directory, top-down, without following symlinked dirs"""
+    subdirs = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        subdirs.append(entry.path)
+                else:
+                    yield entry.path
+    except (PermissionError, OSError):
+        # Skip directories we can't read
+        return
+
+    for subdir in subdirs:
+        yield from _walk_files(subdir)
+
+
+def _grep_file(
+    file_path: str,
+    search: Callable[[str], Any],
+    matches: List[Tuple[str, int, str]],
+    needle: Optional[bytes] = None,
+) -> None:
+    """Append (file_path, line_number, line) for each line search accepts
+
+    When needle is given, files whose raw bytes do not contain it are
+    skipped before any decoding or line splitting.
+    """
+    try:
+        if needle is None:
+            f = open(file_path, "r", encoding="utf-8", errors="ignore")
+        else:
+            with open(file_path, "rb") as raw_file:
+                if os.fstat(raw_file.fileno()).st_size < _MMAP_MIN_SIZE:
+                    raw = raw_file.read()
+                    if needle not in raw:
+                        return
+                else:
+                    # Scan large files through the page cache; only a file
+                    # that contains the needle is copied out for decoding
+                    with mmap.mmap(
+                        raw_file.fileno(), 0, access=mmap.ACCESS_READ
+                    ) as mapped:
+                        if mapped.find(needle) == -1:
+                            return
+                        raw = mapped[:]
+            f = io.StringIO(raw.decode("utf-8", errors="ignore"), newline=None)
+
+        with f:
+            for line_no, line in enumerate(f, start=1):
+                if search(line):
+                    matches.append((file_path, line_no, line.strip()))
+    except (PermissionError, OSError):
+        # Skip files we can't read
+        pass
+
+
 def tree(directory: str, prefix: str = "", depth_remaining: int = 3) -> str:
     """Generate a directory tree structure
 
@@ -90,27 +235,27 @@ def tree(directory: str, prefix: str = "", depth_remaining: int = 3) -> str:
         return ""
 
     try:
-        contents = os.listdir(directory)
+        with os.scandir(directory) as it:
+            contents = sorted(it, key=lambda entry: entry.name)
     except (PermissionError, OSError):
         return f"{prefix}[Permission Denied]"
 
     entries = []
-    for i, entry in enumerate(sorted(contents)):
+    for i, entry in enumerate(contents):
         is_last = i == len(contents) - 1
         new_prefix = prefix + ("└── " if is_last else "├── ")
-        child_path = os.path.join(directory, entry)
 
-        if os.path.isdir(child_path):
-            entries.append(new_prefix + entry + "/")
+        if entry.is_dir():
+            entries.append(new_prefix + entry.name + "/")
             subtree = tree(
-                child_path,
+                entry.path,
                 prefix + ("    " if is_last else "│   "),
                 depth_remaining - 1,
             )
             if subtree:  # Only extend if subtree is not empty
                 entries.extend(subtree.split("\n"))
         else:
-            entries.append(new_prefix + entry)
+            entries.append(new_prefix + entry.name)
 
     return "\n".join(filter(None, entries))  # Filter out empty strings
 
@@ -129,70 +274,17 @@ def find_function_signatures(file_path: str, language: str) -> List[Tuple[int, s
     if not file_path or not os.path.exists(file_path):
         return []
 
-    patterns = {
-        "javascript": [
-            r"function\s+[a-zA-Z_$][\w$]*\s*\(",  # Named function
-            r"\bfunction\s*\(",  # Anonymous function
-            r"[a-zA-Z_$][\w$]*\s*=\s*function\s*\(",  # Function assigned to a variable
-            r"[a-zA-Z_$][\w$]*\s*=\s*\([^)]*\)\s*=>",  # Arrow function assigned to a variable
-            r"[a-zA-Z_$][\w$]*\s*:\s*function\s*\(",  # Method in an object literal (named function)
-            r"[a-zA-Z_$][\w$]*\s*:\s*\([^)]*\)\s*=>",  # Method in an object literal (arrow function)
-            r"export\s+function\s+[a-zA-Z_$][\w$]*\(",  # Named exported function
-            r"export\s+default\s+function\s*[a-zA-Z_$][\w$]*\s*\(",  # Default exported function (named)
-            r"export\s+default\s+function\s*\(",  # Default exported function (anonymous)
-            r"class\s+[a-zA-Z_$][\w$]*",  # Class definitions
-            r"[a-zA-Z_$][\w$]*\s*\([^)]*\)\s*{",  # Method definitions
-        ],
-        "typescript": [
-            r"function\s+[a-zA-Z_$][\w$]*\s*\(",
-            r"[a-zA-Z_$][\w$]*\s*=\s*\([^)]*\)\s*=>",
-            r"class\s+[a-zA-Z_$][\w$]*",
-            r"interface\s+[a-zA-Z_$][\w$]*",
-            r"type\s+[a-zA-Z_$][\w$]*\s*=",
-        ],
-        "python": [
-            r"def\s+[a-zA-Z_][\w]*\s*\(",  # Function definitions
-            r"class\s+[a-zA-Z_][\w]*",  # Class definitions
-            r"async\s+def\s+[a-zA-Z_][\w]*\s*\(",  # Async function definitions
-        ],
-        "c": [r"\w+\s+[a-zA-Z_][\w]*\s*\([^)]*\)\s*{"],  # Function definitions
-        "cpp": [
-            r"\w+\s+[a-zA-Z_][\w]*\s*\([^)]*\)\s*{",  # Function definitions
-            r"class\s+[a-zA-Z_][\w]*",  # Class definitions
-            r"struct\s+[a-zA-Z_][\w]*",  # Struct definitions
-        ],
-        "java": [
-            r"\w+\s+[a-zA-Z_][\w]*\s*\([^)]*\)\s*{",  # Method definitions
-            r"class\s+[a-zA-Z_][\w]*",  # Class definitions
-            r"interface\s+[a-zA-Z_][\w]*",  # Interface definitions
-        ],
-        "ruby": [
-            r"def\s+[a-zA-Z_][\w]*",  # Method definitions
-            r"class\s+[a-zA-Z_][\w]*",  # Class definitions
-            r"module\s+[a-zA-Z_][\w]*",  # Module definitions
-        ],
-        "go": [
-            r"func\s+[a-zA-Z_][\w]*\s*\(",  # Function definitions
-            r"type\s+[a-zA-Z_][\w]*\s+struct",  # Struct definitions
-            r"type\s+[a-zA-Z_][\w]*\s+interface",  # Interface definitions
-        ],
-        "rust": [
-            r"fn\s+[a-zA-Z_][\w]*\s*\(",  # Function definitions
-            r"struct\s+[a-zA-Z_][\w]*",  # Struct definitions
-            r"enum\s+[a-zA-Z_][\w]*",  # Enum definitions
-            r"trait\s+[a-zA-Z_][\w]*",  # Trait definitions
-        ],
-    }
+    regex = _SIGNATURE_REGEXES.get(language.lower())
+    if regex is None:
+        return []
 
     matches = []
     try:
         with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
             for line_no, line in enumerate(f, start=1):
-                for pattern in patterns.get(language.lower(), []):
-                    match = re.search(pattern, line.strip())
-                    if match:
-                        matches.append((line_no, line.strip()))
-                        break  # Only match one pattern per line
+                stripped = line.strip()
+                if regex.search(stripped):
+                    matches.append((line_no, stripped))
     except (PermissionError, OSError):
         pass
 
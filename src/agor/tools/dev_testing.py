@@ -10,9 +10,11 @@ Functions:
 - Environment validation and setup utilities
 """
 
+import os
 import sys
-from pathlib import Path
-from typing import Any, Dict
+import time
+from functools import lru_cache
+from typing import Any, Dict, Tuple
 
 from agor.tools.git_operations import (
     get_current_timestamp,
@@ -22,6 +24,32 @@ from agor.tools.git_operations import (
     run_git_command,
 )
 
+# Layout markers detect_environment() looks for. Status, health and prompt
+# helpers often call it back to back, so the answers are reused for a few
+# seconds per working directory instead of re-checking every path each time.
+_LAYOUT_MARKERS = (".pyenv", "src/agor", "pyproject.toml", "src/agor/tools")
+_LAYOUT_TTL = 5.0
+_layout_cache: Dict[str, Tuple[float, Dict[str, bool]]] = {}
+
+
+def _layout_markers() -> Dict[str, bool]:
+    """Return which layout markers exist in the working directory."""
+    cwd = os.getcwd()
+    now = time.monotonic()
+    cached = _layout_cache.get(cwd)
+    if cached is not None and now - cached[0] < _LAYOUT_TTL:
+        return cached[1]
+    markers = {marker: os.path.exists(marker) for marker in _LAYOUT_MARKERS}
+    _layout_cache[cwd] = (now, markers)
+    return markers
+
+
+@lru_cache(maxsize=1)
+def _git_available() -> bool:
+    """Return whether git runs, probing once per process."""
+    success, _ = run_git_command(["--version"])
+    return success
+
 
 def detect_environment() -> Dict[str, Any]:
     """
@@ -45,18 +73,19 @@ def detect_environment() -> Dict[str, Any]:
         "has_pyenv": False,
     }
 
-    # Detect git availability
-    success, _ = run_git_command(["--version"])
-    environment["has_git"] = success
+    # Detect git availability (cached; the binary does not change mid-run)
+    environment["has_git"] = _git_available()
+
+    markers = _layout_markers()
 
     # Check for .pyenv directory
-    environment["has_pyenv"] = Path(".pyenv").exists()
+    environment["has_pyenv"] = markers[".pyenv"]
 
     # Detect mode based on environment
-    if Path("src/agor").exists() and Path("pyproject.toml").exists():
+    if markers["src/agor"] and markers["pyproject.toml"]:
         environment["mode"] = "development"
         environment["platform"] = "Development Environment"
-    elif Path("src/agor/tools").exists():
+    elif markers["src/agor/tools"]:
         environment["mode"] = "standalone"
         environment["platform"] = "Standalone Mode"
     else:
@@ -96,56 +125,70 @@ def test_tooling() -> bool:
     Returns:
         True if all tests pass, False otherwise
     """
-    print("🧪 Testing AGOR Development Tools...")
+    # Results are collected per phase and written in one call each, rather
+    # than one print (and, on a terminal, one flush) per line
+    sys.stdout.write("🧪 Testing AGOR Development Tools...\n")
+    report = ["Testing dev tools functions..."]
 
     try:
-        print("Testing dev tools functions...")
-
         # Test timestamp functions
         current_ts = get_current_timestamp()
         file_ts = get_file_timestamp()
         precise_ts = get_precise_timestamp()
         ntp_ts = get_ntp_timestamp()
 
-        print(f"📅 Current timestamp: {current_ts}")
-        print(f"📁 File timestamp: {file_ts}")
-        print(f"⏰ Precise timestamp: {precise_ts}")
-        print(f"🌐 NTP timestamp: {ntp_ts}")
+        report += [
+            f"📅 Current timestamp: {current_ts}",
+            f"📁 File timestamp: {file_ts}",
+            f"⏰ Precise timestamp: {precise_ts}",
+            f"🌐 NTP timestamp: {ntp_ts}",
+        ]
+        _flush_report(report)
 
         # Test git operations (git binary detection handled in run_git_command)
         success, version_output = run_git_command(["--version"])
         if success:
-            print(f"✅ Git working: {version_output.strip()}")
+            report.append(f"✅ Git working: {version_output.strip()}")
         else:
-            print(f"❌ Git not available: {version_output}")
+            report.append(f"❌ Git not available: {version_output}")
+            _flush_report(report)
             return False
 
         # Test current branch detection
         success, branch = run_git_command(["branch", "--show-current"])
         if success:
-            print(f"🌿 Current branch: {branch.strip()}")
+            report.append(f"🌿 Current branch: {branch.strip()}")
         else:
-            print(f"⚠️  Branch detection issue: {branch}")
+            report.append(f"⚠️  Branch detection issue: {branch}")
 
         # Test working directory status
         success, status = run_git_command(["status", "--porcelain"])
         if success:
             if status.strip():
                 lines = status.strip().split("\n")
-                print(f"📝 Working directory has changes: {len(lines)} files")
+                report.append(f"📝 Working directory has changes: {len(lines)} files")
             else:
-                print("📝 Working directory clean")
+                report.append("📝 Working directory clean")
         else:
-            print(f"⚠️  Status check issue: {status}")
+            report.append(f"⚠️  Status check issue: {status}")
 
-        print("🎉 Development tooling test completed successfully!")
+        report.append("🎉 Development tooling test completed successfully!")
+        _flush_report(report)
         return True
 
     except Exception as e:
-        print(f"❌ Development tooling test failed: {e}")
+        report.append(f"❌ Development tooling test failed: {e}")
+        _flush_report(report)
         return False
 
 
+def _flush_report(report: list) -> None:
+    """Write the pending report lines to stdout in one call and clear them."""
+    if report:
+        sys.stdout.write("\n".join(report) + "\n")
+        report.clear()
+
+
 def get_agent_dependency_install_commands() -> str:
     """
     Returns shell commands for installing agent development tools dependencies,
@@ -15,7 +15,15 @@ It imports functionality from specialized modules for better organization:
 Provides a clean API interface while keeping individual modules under 500 LOC.
 """
 
+import hashlib
+import os
+import shutil
+import subprocess
+import tempfile
 import textwrap
+import time
+import uuid
+import warnings
 from typing import Dict, List, Tuple
 
 from agor.tools.agent_prompts import detick_content, retick_content
@@ -76,8 +84,6 @@ except ImportError:
             Raises:
                 RuntimeError: If the git binary is not found in the system PATH.
             """
-            import shutil
-
             git_path = shutil.which("git")
             if not git_path:
                 raise RuntimeError("Git not found in PATH")
@@ -513,7 +519,6 @@ def get_or_create_agent_id_file(agent_id: str = None) -> str:
     Returns:
         Agent ID string
     """
-    import tempfile
     from pathlib import Path
 
     # Use /tmp/agor/ directory for agent ID persistence
@@ -573,11 +578,6 @@ def generate_unique_agent_id() -> str:
     Returns:
         A string agent ID in format 'agent_{hash}_{timestamp}' for unique identification.
     """
-    import hashlib
-    import os
-    import time
-    import uuid
-
     # Create truly unique identifier using multiple sources
     full_timestamp = str(
         int(time.time())
@@ -765,8 +765,6 @@ def cleanup_agent_directories(
         True if cleanup was successful, False otherwise
     """
     try:
-        import os
-        import subprocess
         from datetime import datetime, timedelta
 
         memory_branch = get_main_memory_branch(custom_branch)
@@ -856,8 +854,6 @@ def cleanup_agent_directories(
                         continue
 
                 # Remove the directory
-                import shutil
-
                 try:
                     shutil.rmtree(agent_path)
                     print(f"✅ Removed agent directory: {agent_dir}")
@@ -928,9 +924,6 @@ def check_pending_handoffs(custom_branch: str = None) -> list:
         List of pending handoff files
     """
     try:
-        import os
-        import subprocess
-
         memory_branch = get_main_memory_branch(custom_branch)
 
         # Capture current branch before switching
@@ -1111,8 +1104,6 @@ def cleanup_agent_memory_branches(
     Returns:
         True if cleanup was successful, False otherwise
     """
-    import warnings
-
     warnings.warn(
         "cleanup_agent_memory_branches() is deprecated. Use cleanup_agent_directories() instead.",
         DeprecationWarning,
@@ -1120,8 +1111,6 @@ def cleanup_agent_memory_branches(
     )
 
     try:
-        import subprocess
-
         # Get current agent ID safely - don't generate new one
         if keep_current:
             if current_agent_id:
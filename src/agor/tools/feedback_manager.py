@@ -14,12 +14,38 @@ Key Features:
 import datetime
 import json
 import shutil
-from dataclasses import dataclass, field
+from dataclasses import MISSING, dataclass, field, fields
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from agor.tools.template_engine import TemplateEngine
 
+try:
+    import orjson  # Optional: several times faster than json for the history file
+except ImportError:
+    orjson = None
+
+
+def _dump_history(data: Any) -> str:
+    """
+    Serialize the feedback history file, using orjson when available.
+
+    Only the private history file goes through orjson; its output (raw
+    non-ASCII rather than \\u escapes) differs from json.dumps, so anything
+    returned to callers uses json.dumps to stay the same on every install.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+
+def _load_history(text: str) -> Any:
+    """Parse JSON, using orjson when available (its errors subclass JSONDecodeError)."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
 # Define allowed severity levels
 ALLOWED_SEVERITIES = {"low", "medium", "high", "critical"}
 
@@ -34,6 +60,14 @@ FEEDBACK_TYPE_LABELS = {
     "usability": "UX",
 }
 
+# Severity level to label mapping
+SEVERITY_LABELS = {
+    "low": "priority: low",
+    "medium": "priority: medium",
+    "high": "priority: high",
+    "critical": "priority: critical",
+}
+
 
 @dataclass
 class FeedbackEntry:
@@ -50,6 +84,55 @@ class FeedbackEntry:
     timestamp: Optional[str] = None
     agent_id: Optional[str] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the entry as a plain dict for the history file."""
+        # Built field by field; dataclasses.asdict would deep-copy every list
+        return {
+            "feedback_type": self.feedback_type,
+            "feedback_content": self.feedback_content,
+            "suggestions": self.suggestions,
+            "severity": self.severity,
+            "component": self.component,
+            "reproduction_steps": self.reproduction_steps,
+            "expected_behavior": self.expected_behavior,
+            "actual_behavior": self.actual_behavior,
+            "timestamp": self.timestamp,
+            "agent_id": self.agent_id,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FeedbackEntry":
+        """Rebuild an entry from the history file without going through __init__."""
+        # Same failures as FeedbackEntry(**data): unknown or missing fields
+        unknown = data.keys() - _FEEDBACK_ENTRY_FIELDS
+        if unknown:
+            raise TypeError(f"Unexpected feedback entry fields: {sorted(unknown)}")
+        missing = _FEEDBACK_ENTRY_REQUIRED - data.keys()
+        if missing:
+            raise TypeError(f"Feedback entry is missing fields: {sorted(missing)}")
+
+        entry = object.__new__(cls)
+        entry.__dict__.update(_FEEDBACK_ENTRY_DEFAULTS)
+        for name, factory in _FEEDBACK_ENTRY_FACTORIES.items():
+            entry.__dict__[name] = factory()  # A fresh list for every entry
+        entry.__dict__.update(data)
+        return entry
+
+
+_FEEDBACK_ENTRY_FIELDS = frozenset(f.name for f in fields(FeedbackEntry))
+# Read from the dataclass so from_dict can't drift from its declared defaults
+_FEEDBACK_ENTRY_DEFAULTS = {
+    f.name: f.default for f in fields(FeedbackEntry) if f.default is not MISSING
+}
+_FEEDBACK_ENTRY_FACTORIES = {
+    f.name: f.default_factory
+    for f in fields(FeedbackEntry)
+    if f.default_factory is not MISSING
+}
+_FEEDBACK_ENTRY_REQUIRED = _FEEDBACK_ENTRY_FIELDS - (
+    _FEEDBACK_ENTRY_DEFAULTS.keys() | _FEEDBACK_ENTRY_FACTORIES.keys()
+)
+
 
 @dataclass
 class GitHubIssueConfig:
@@ -65,6 +148,11 @@ class GitHubIssueConfig:
     actual_behavior: Optional[str] = None
 
 
+def _preview(text: str, limit: int = 100) -> str:
+    """Return text cut to limit characters, marked with "..." when cut."""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
 class FeedbackManager:
     """
     Manages feedback collection, processing, and analysis for AGOR.
@@ -80,8 +168,9 @@ class FeedbackManager:
         Args:
             feedback_dir: Directory for storing feedback data
         """
+        # Created on first save: a module-level manager is built at import
+        # time, and importing shouldn't leave .agor/feedback behind
         self.feedback_dir = feedback_dir or Path(".agor/feedback")
-        self.feedback_dir.mkdir(parents=True, exist_ok=True)
 
         self.template_engine = TemplateEngine()
         self.feedback_history: List[FeedbackEntry] = []
@@ -92,11 +181,10 @@ class FeedbackManager:
         history_file = self.feedback_dir / "feedback_history.json"
         if history_file.exists():
             try:
-                with open(history_file) as f:
-                    history_data = json.load(f)
+                history_data = _load_history(history_file.read_text(encoding="utf-8"))
 
                 for entry_data in history_data.get("feedback", []):
-                    entry = FeedbackEntry(**entry_data)
+                    entry = FeedbackEntry.from_dict(entry_data)
                     self.feedback_history.append(entry)
             except (json.JSONDecodeError, TypeError) as e:
                 print(f"⚠️ Error loading feedback history: {e}")
@@ -108,25 +196,11 @@ class FeedbackManager:
         history_file = self.feedback_dir / "feedback_history.json"
 
         history_data = {
-            "feedback": [
-                {
-                    "feedback_type": entry.feedback_type,
-                    "feedback_content": entry.feedback_content,
-                    "suggestions": entry.suggestions,
-                    "severity": entry.severity,
-                    "component": entry.component,
-                    "reproduction_steps": entry.reproduction_steps,
-                    "expected_behavior": entry.expected_behavior,
-                    "actual_behavior": entry.actual_behavior,
-                    "timestamp": entry.timestamp,
-                    "agent_id": entry.agent_id,
-                }
-                for entry in self.feedback_history
-            ]
+            "feedback": [entry.to_dict() for entry in self.feedback_history]
         }
 
-        with open(history_file, "w") as f:
-            json.dump(history_data, f, indent=2)
+        self.feedback_dir.mkdir(parents=True, exist_ok=True)
+        history_file.write_text(_dump_history(history_data), encoding="utf-8")
 
     def _backup_corrupted_file(self, corrupted_file: Path, error: Exception) -> None:
         """
@@ -302,15 +376,6 @@ Priority: {{ severity }}
         Returns:
             A string containing the rendered GitHub issue content, including title, component, severity, description, reproduction steps, expected and actual behavior (for bugs), suggested solutions, and appropriate labels.
         """
-        # Use global feedback type labels mapping
-
-        severity_labels = {
-            "low": "priority: low",
-            "medium": "priority: medium",
-            "high": "priority: high",
-            "critical": "priority: critical",
-        }
-
         context = {
             "title": config.feedback_type.replace("_", " ").title(),
             "component": config.component,
@@ -322,7 +387,7 @@ Priority: {{ severity }}
             "actual_behavior": config.actual_behavior,
             "suggestions": config.suggestions,
             "type_label": FEEDBACK_TYPE_LABELS.get(config.feedback_type, "feedback"),
-            "severity_label": severity_labels.get(config.severity, "priority: medium"),
+            "severity_label": SEVERITY_LABELS.get(config.severity, "priority: medium"),
         }
 
         template = """## {{ title }}
@@ -390,30 +455,20 @@ Priority: {{ severity }}
                 "recent_feedback": [],
             }
 
-        # Count by type
+        # Count by type, severity and component in one pass over the history
         by_type = {}
-        for entry in self.feedback_history:
-            by_type[entry.feedback_type] = by_type.get(entry.feedback_type, 0) + 1
-
-        # Count by severity
         by_severity = {}
-        for entry in self.feedback_history:
-            by_severity[entry.severity] = by_severity.get(entry.severity, 0) + 1
-
-        # Count by component
         by_component = {}
         for entry in self.feedback_history:
+            by_type[entry.feedback_type] = by_type.get(entry.feedback_type, 0) + 1
+            by_severity[entry.severity] = by_severity.get(entry.severity, 0) + 1
             by_component[entry.component] = by_component.get(entry.component, 0) + 1
 
         # Get recent feedback (last 5)
         recent_feedback = [
             {
                 "type": entry.feedback_type,
-                "content": (
-                    entry.feedback_content[:100] + "..."
-                    if len(entry.feedback_content) > 100
-                    else entry.feedback_content
-                ),
+                "content": _preview(entry.feedback_content),
                 "severity": entry.severity,
                 "timestamp": entry.timestamp,
             }
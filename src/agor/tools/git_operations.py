@@ -10,12 +10,15 @@ Functions:
 - Timestamp generation for git operations
 """
 
-import shutil
+import os
 import subprocess
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Tuple
 
+from agor.platform import which
+
 
 def get_current_timestamp() -> str:
     """Get current timestamp in AGOR format."""
@@ -51,20 +54,148 @@ def get_ntp_timestamp() -> str:
         return get_current_timestamp()
 
 
-def run_git_command(command: list, env: Optional[dict] = None) -> Tuple[bool, str]:
+# Environment overrides libgit2 does not honour the way git does; with any of
+# these set, queries always go through the git binary
+_GIT_LOCATION_ENV = (
+    "GIT_DIR",
+    "GIT_WORK_TREE",
+    "GIT_INDEX_FILE",
+    "GIT_OBJECT_DIRECTORY",
+)
+
+# Characters that make `git status --porcelain` quote a path
+_PORCELAIN_QUOTED_CHARS = ' "\\'
+
+
+@lru_cache(maxsize=8)
+def _open_pygit2_repository(cwd: str):
+    """
+    Open the repository containing cwd with pygit2, or return None.
+
+    pygit2 is optional; the Repository is kept per working directory so its
+    object database and index stay loaded between queries.
+    """
+    try:
+        import pygit2
+    except ImportError:
+        return None
+    path = pygit2.discover_repository(cwd)
+    if path is None:
+        return None
+    repo = pygit2.Repository(path)
+    return None if repo.is_bare else repo
+
+
+def _porcelain_status_line(pygit2, path: str, flags: int) -> Optional[str]:
+    """Format one pygit2 status entry as a `git status --porcelain` line."""
+    if flags == pygit2.GIT_STATUS_WT_NEW:
+        return f"?? {path}"
+    index = " "
+    for flag, code in (
+        (pygit2.GIT_STATUS_INDEX_NEW, "A"),
+        (pygit2.GIT_STATUS_INDEX_MODIFIED, "M"),
+        (pygit2.GIT_STATUS_INDEX_DELETED, "D"),
+        (pygit2.GIT_STATUS_INDEX_TYPECHANGE, "T"),
+    ):
+        if flags & flag:
+            index = code
+    worktree = " "
+    for flag, code in (
+        (pygit2.GIT_STATUS_WT_MODIFIED, "M"),
+        (pygit2.GIT_STATUS_WT_DELETED, "D"),
+        (pygit2.GIT_STATUS_WT_TYPECHANGE, "T"),
+    ):
+        if flags & flag:
+            worktree = code
+    if index == worktree == " ":
+        return None
+    return f"{index}{worktree} {path}"
+
+
+def _run_git_in_process(command: list) -> Optional[str]:
+    """
+    Answer a common read-only git query with pygit2 instead of a subprocess.
+
+    Returns the output git would print, or None when pygit2 is unavailable or
+    the query falls outside what can be reproduced exactly; the caller then
+    runs the git binary as usual.
+    """
+    if any(name in os.environ for name in _GIT_LOCATION_ENV):
+        return None
+    repo = _open_pygit2_repository(str(Path.cwd()))
+    if repo is None:
+        return None
+    import pygit2
+
+    if command == ["rev-parse", "HEAD"]:
+        if repo.head_is_unborn:
+            return None
+        return f"{repo.head.target}\n"
+
+    if command == ["branch", "--show-current"]:
+        head = repo.references.get("HEAD")
+        if head is None:
+            return None
+        target = head.target
+        if not isinstance(target, str):
+            return ""  # Detached HEAD: git prints nothing
+        return f"{target.removeprefix('refs/heads/')}\n"
+
+    if command == ["status", "--porcelain"]:
+        entries = repo.status(untracked_files="normal")
+        tracked, untracked = [], []
+        index_new = index_deleted = False
+        for path, flags in sorted(entries.items()):
+            # git quotes unusual paths, pairs staged adds/deletes into renames,
+            # lists an untracked copy of a staged path twice and prints
+            # conflicts with its own codes; leave all of those to git
+            if not path.isascii() or not path.isprintable():
+                return None
+            if any(char in path for char in _PORCELAIN_QUOTED_CHARS):
+                return None
+            if flags & pygit2.GIT_STATUS_CONFLICTED:
+                return None
+            if flags & pygit2.GIT_STATUS_WT_NEW and flags != pygit2.GIT_STATUS_WT_NEW:
+                return None
+            index_new = index_new or bool(flags & pygit2.GIT_STATUS_INDEX_NEW)
+            index_deleted = index_deleted or bool(
+                flags & pygit2.GIT_STATUS_INDEX_DELETED
+            )
+            line = _porcelain_status_line(pygit2, path, flags)
+            if line is not None:
+                (untracked if line.startswith("??") else tracked).append(line)
+        if index_new and index_deleted:
+            return None
+        return "".join(f"{line}\n" for line in tracked + untracked)
+
+    return None
+
+
+def run_git_command(
+    command: list, env: Optional[dict] = None, input: Optional[str] = None
+) -> Tuple[bool, str]:
     """
     Execute a git command and return success status and output.
 
     Args:
         command: List of git command arguments (without 'git')
         env: Optional environment variables to pass to git command
+        input: Optional text fed to the command's stdin, encoded as UTF-8
 
     Returns:
         Tuple of (success: bool, output: str)
     """
+    if env is None and input is None:
+        try:
+            output = _run_git_in_process(command)
+        except Exception:
+            output = None  # Any pygit2 hiccup: let the git binary answer
+        if output is not None:
+            return True, output
+
     try:
         # Detect git binary using shutil.which for better cross-platform compatibility
-        git_binary = shutil.which("git")
+        git_binary = which("git")
         if git_binary is None:
             git_binary = "git"  # Fallback
 
@@ -73,6 +204,9 @@ def run_git_command(command: list, env: Optional[dict] = None) -> Tuple[bool, st
             full_command,
             capture_output=True,
             text=True,
+            # Content piped to git (e.g. hash-object --stdin) is stored as UTF-8
+            encoding="utf-8" if input is not None else None,
+            input=input,
             timeout=30,
             cwd=Path.cwd(),
             env=env,
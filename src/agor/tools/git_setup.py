@@ -28,9 +28,14 @@ def run_command(cmd, check=True, capture_output=True):
 
 def get_current_git_config():
     """Get current git configuration."""
-    name = run_command("git config user.name", check=False)
-    email = run_command("git config user.email", check=False)
-    return name, email
+    # One git process for both keys; for repeated keys the last one wins,
+    # as with a plain `git config user.name`
+    output = run_command('git config --get-regexp "^user[.](name|email)$"', check=False)
+    config = {}
+    for line in (output or "").splitlines():
+        key, _, value = line.partition(" ")
+        config[key] = value
+    return config.get("user.name", ""), config.get("user.email", "")
 
 
 def get_environment_config():
@@ -202,26 +207,26 @@ def setup_git_manual(name, email, global_scope=False):
     print("\n🚀 Git configuration complete!")
 
 
+_USAGE = "\n".join(
+    (
+        "",
+        "Usage:",
+        "  python git_setup.py --show                    # Show current config",
+        "  python git_setup.py --apply-bundle           # Apply config from bundle",
+        "  python git_setup.py --import-env              # Import from environment",
+        "  python git_setup.py --set 'Name' 'email@example.com'  # Set manually",
+        "  python git_setup.py --set 'Name' 'email@example.com' --global  # Set globally",
+        "",
+    )
+)
+
+
 def main():
     """Main function for command-line usage."""
     if len(sys.argv) == 1:
-        print("🛠️  AGOR Git Configuration Setup")
-        print("=" * 40)
-        print()
+        sys.stdout.write(f"🛠️  AGOR Git Configuration Setup\n{'=' * 40}\n\n")
         show_config()
-        print()
-        print("Usage:")
-        print("  python git_setup.py --show                    # Show current config")
-        print(
-            "  python git_setup.py --apply-bundle           # Apply config from bundle"
-        )
-        print(
-            "  python git_setup.py --import-env              # Import from environment"
-        )
-        print("  python git_setup.py --set 'Name' 'email@example.com'  # Set manually")
-        print(
-            "  python git_setup.py --set 'Name' 'email@example.com' --global  # Set globally"
-        )
+        sys.stdout.write(_USAGE)
         return
 
     if "--show" in sys.argv:
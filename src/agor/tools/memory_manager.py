@@ -28,35 +28,13 @@ def get_empty_tree_hash() -> str:
     Returns:
         Empty tree hash as string
     """
-    # Method 1: Create empty tree using write-tree with empty index
-    temp_index_fd, temp_index_path = tempfile.mkstemp(
-        suffix=".index", prefix="empty_tree_"
+    # Method 1: Hash an empty tree object from empty stdin; git derives the
+    # id in the repository's object format without any temporary index file
+    success, output = run_git_command(
+        ["hash-object", "-w", "-t", "tree", "--stdin"], input=""
     )
-    temp_index_file = Path(temp_index_path)
-
-    try:
-        # Close the file descriptor but keep the file
-        os.close(temp_index_fd)
-
-        # Create a minimal empty index file
-        with open(temp_index_file, "wb") as f:
-            # Write minimal git index header (version 2, 0 entries)
-            f.write(b"DIRC")  # signature
-            f.write(b"\x00\x00\x00\x02")  # version 2
-            f.write(b"\x00\x00\x00\x00")  # 0 entries
-            # Add SHA-1 checksum of the header (20 bytes of zeros for simplicity)
-            f.write(b"\x00" * 20)
-
-        empty_env = os.environ.copy()
-        empty_env["GIT_INDEX_FILE"] = str(temp_index_file)
-        success, output = run_git_command(["write-tree"], env=empty_env)
-        if success:
-            return output.strip()
-    except Exception:
-        pass
-    finally:
-        if temp_index_file.exists():
-            temp_index_file.unlink()
+    if success:
+        return output.strip()
 
     # Method 2: Use known SHA-1 hash as fallback (most repositories are SHA-1)
     return "4b825dc642cb6eb9a060e54bf8d69288fbee4904"
@@ -100,13 +78,17 @@ def commit_to_memory_branch(
         commit_message = f"Memory update: {file_name}"
 
     try:
-        # Step 1: Check if memory branch exists
-        success, _ = run_git_command(
+        # Step 1: Check if memory branch exists; the resolved commit is kept
+        # as the parent so the branch is only looked up once
+        success, branch_commit_output = run_git_command(
             ["rev-parse", "--verify", f"refs/heads/{branch_name}"]
         )
         branch_exists = success
 
-        if not branch_exists:
+        if branch_exists:
+            parent_commit = branch_commit_output.strip()
+            tree_hash = None
+        else:
             # Create new memory branch with empty tree (only .agor files)
             print(f"📝 Creating new memory branch: {branch_name}")
 
@@ -139,146 +121,127 @@ def commit_to_memory_branch(
             print(
                 f"✅ Created memory branch {branch_name} with empty tree (commit: {initial_commit[:8]})"
             )
+            parent_commit = initial_commit
+            tree_hash = empty_tree_hash
 
-        # Step 2: Create temporary file with content
-        temp_file = None
-        try:
-            temp_fd, temp_path = tempfile.mkstemp(suffix=".tmp", prefix="agor_memory_")
-            temp_file = Path(temp_path)
-
-            # Write content to temporary file
-            with os.fdopen(temp_fd, "w", encoding="utf-8") as f:
-                f.write(file_content)
-
-            # Step 3: Add file to git index for the memory branch
-            print(f"   Hashing file content for {file_name}...")
-            success, blob_hash_output = run_git_command(["hash-object", "-w", str(temp_file)])
-            if not success:
-                print(f"❌ Failed to create blob object from temp file. Error: {blob_hash_output}")
-                return False
-            blob_hash = blob_hash_output.strip()
-            print(f"   Blob hash created: {blob_hash[:12]}")
+        # Step 2: Store the content as a blob, piped straight to git
+        print(f"   Hashing file content for {file_name}...")
+        success, blob_hash_output = run_git_command(
+            ["hash-object", "-w", "--stdin"], input=file_content
+        )
+        if not success:
+            print(f"❌ Failed to create blob object. Error: {blob_hash_output}")
+            return False
+        blob_hash = blob_hash_output.strip()
+        print(f"   Blob hash created: {blob_hash[:12]}")
 
-            # Step 4: Get current tree of memory branch
+        # Step 3: Get current tree of memory branch (already known for a new one)
+        if tree_hash is None:
             print(f"   Getting current tree for memory branch {branch_name}...")
             success, tree_hash_output = run_git_command(
-                ["rev-parse", f"{branch_name}^{{tree}}"]
+                ["rev-parse", f"{parent_commit}^{{tree}}"]
             )
             if not success:
                 print(f"   Warning: Could not parse tree for {branch_name}. Assuming empty tree. Error: {tree_hash_output}")
                 tree_hash = get_empty_tree_hash()
             else:
                 tree_hash = tree_hash_output.strip()
-            print(f"   Using tree hash: {tree_hash[:12]}")
+        print(f"   Using tree hash: {tree_hash[:12]}")
 
-            # Step 5: Create new tree with our file
-            # Create a temporary index file
-            temp_index_fd, temp_index_path = tempfile.mkstemp(
-                suffix=".index", prefix="agor_"
-            )
-            os.close(temp_index_fd)
-            temp_index_file = Path(temp_index_path)
-
-            try:
-                # Set temporary index
-                env = os.environ.copy()
-                env["GIT_INDEX_FILE"] = str(temp_index_file)
-
-                # Initialize index (always read tree, even if empty)
-                print(f"   Reading tree {tree_hash[:12]} into temporary index...")
-                success, rt_output = run_git_command(["read-tree", tree_hash], env=env)
-                if not success:
-                    print(f"❌ `git read-tree` failed for tree {tree_hash}. Error: {rt_output}")
-                    return False
-                print(f"   Tree read successfully.")
-
-                # Add our file to index
-                # Note: file_name should already include .agor/ prefix if needed
-                print(f"   Adding file {file_name} (blob {blob_hash[:12]}) to temporary index...")
-                success, ui_output = run_git_command(
-                    [
-                        "update-index",
-                        "--add",
-                        "--cacheinfo",
-                        "100644",
-                        blob_hash,
-                        file_name,
-                    ],
-                    env=env,
-                )
-                if not success:
-                    print(f"❌ Failed to update index with file {file_name}. Error: {ui_output}")
-                    return False
-                print(f"   Index updated successfully with {file_name}.")
-
-                # Write new tree
-                print(f"   Writing new tree from temporary index...")
-                success, new_tree_hash_output = run_git_command(["write-tree"], env=env)
-                if not success:
-                    print(f"❌ Failed to write new tree. Error: {new_tree_hash_output}")
-                    return False
-                new_tree_hash = new_tree_hash_output.strip()
-                print(f"   New tree created: {new_tree_hash[:12]}")
-
-            finally:
-                # Clean up temporary index
-                if temp_index_file.exists():
-                    temp_index_file.unlink()
-
-            # Step 6: Create commit on memory branch
-            print(f"   Getting parent commit for branch {branch_name}...")
-            success, parent_commit_output = run_git_command(["rev-parse", branch_name])
+        # Step 4: Create new tree with our file
+        # Create a temporary index file
+        temp_index_fd, temp_index_path = tempfile.mkstemp(
+            suffix=".index", prefix="agor_"
+        )
+        os.close(temp_index_fd)
+        temp_index_file = Path(temp_index_path)
+
+        try:
+            # Set temporary index
+            env = os.environ.copy()
+            env["GIT_INDEX_FILE"] = str(temp_index_file)
+
+            # Initialize index (always read tree, even if empty)
+            print(f"   Reading tree {tree_hash[:12]} into temporary index...")
+            success, rt_output = run_git_command(["read-tree", tree_hash], env=env)
             if not success:
-                print(f"❌ Failed to get parent commit for {branch_name}. Error: {parent_commit_output}")
+                print(f"❌ `git read-tree` failed for tree {tree_hash}. Error: {rt_output}")
                 return False
-            parent_commit = parent_commit_output.strip()
-            print(f"   Parent commit: {parent_commit[:12]}")
+            print(f"   Tree read successfully.")
 
-            print(f"   Creating new commit with tree {new_tree_hash[:12]} and parent {parent_commit[:12]}...")
-            success, new_commit_output = run_git_command(
+            # Add our file to index
+            # Note: file_name should already include .agor/ prefix if needed
+            print(f"   Adding file {file_name} (blob {blob_hash[:12]}) to temporary index...")
+            success, ui_output = run_git_command(
                 [
-                    "commit-tree",
-                    new_tree_hash,
-                    "-p",
-                    parent_commit,
-                    "-m",
-                    commit_message,
-                ]
+                    "update-index",
+                    "--add",
+                    "--cacheinfo",
+                    "100644",
+                    blob_hash,
+                    file_name,
+                ],
+                env=env,
             )
             if not success:
-                print(f"❌ Failed to create new commit object. Error: {new_commit_output}")
+                print(f"❌ Failed to update index with file {file_name}. Error: {ui_output}")
                 return False
-            new_commit = new_commit_output.strip()
-            print(f"   New commit created: {new_commit[:12]}")
+            print(f"   Index updated successfully with {file_name}.")
 
-            # Step 7: Update branch reference
-            print(f"   Updating branch reference {branch_name} to point to new commit {new_commit[:12]}...")
-            success, update_ref_output_final = run_git_command(
-                ["update-ref", f"refs/heads/{branch_name}", new_commit]
-            )
+            # Write new tree
+            print(f"   Writing new tree from temporary index...")
+            success, new_tree_hash_output = run_git_command(["write-tree"], env=env)
             if not success:
-                print(f"❌ Failed to update branch reference {branch_name}. Error: {update_ref_output_final}")
+                print(f"❌ Failed to write new tree. Error: {new_tree_hash_output}")
                 return False
+            new_tree_hash = new_tree_hash_output.strip()
+            print(f"   New tree created: {new_tree_hash[:12]}")
 
-            # Step 8: Push memory branch (optional, don't fail if this doesn't work)
-            # Use safe push for memory branches too, but don't fail the whole operation
-            if not safe_git_push(branch_name=branch_name):
-                print(
-                    f"⚠️  Failed to push memory branch {branch_name} (local commit succeeded)"
-                )
+        finally:
+            # Clean up temporary index
+            if temp_index_file.exists():
+                temp_index_file.unlink()
+
+        # Step 5: Create commit on memory branch
+        print(f"   Parent commit: {parent_commit[:12]}")
+
+        print(f"   Creating new commit with tree {new_tree_hash[:12]} and parent {parent_commit[:12]}...")
+        success, new_commit_output = run_git_command(
+            [
+                "commit-tree",
+                new_tree_hash,
+                "-p",
+                parent_commit,
+                "-m",
+                commit_message,
+            ]
+        )
+        if not success:
+            print(f"❌ Failed to create new commit object. Error: {new_commit_output}")
+            return False
+        new_commit = new_commit_output.strip()
+        print(f"   New commit created: {new_commit[:12]}")
+
+        # Step 6: Update branch reference
+        print(f"   Updating branch reference {branch_name} to point to new commit {new_commit[:12]}...")
+        success, update_ref_output_final = run_git_command(
+            ["update-ref", f"refs/heads/{branch_name}", new_commit]
+        )
+        if not success:
+            print(f"❌ Failed to update branch reference {branch_name}. Error: {update_ref_output_final}")
+            return False
 
+        # Step 7: Push memory branch (optional, don't fail if this doesn't work)
+        # Use safe push for memory branches too, but don't fail the whole operation
+        if not safe_git_push(branch_name=branch_name):
             print(
-                f"✅ Successfully committed {file_name} to memory branch {branch_name}"
+                f"⚠️  Failed to push memory branch {branch_name} (local commit succeeded)"
             )
-            return True
 
-        finally:
-            # Clean up temporary file
-            if temp_file and temp_file.exists():
-                try:
-                    temp_file.unlink()
-                except Exception as e:
-                    print(f"⚠️  Failed to cleanup temporary file: {e}")
+        print(
+            f"✅ Successfully committed {file_name} to memory branch {branch_name}"
+        )
+        return True
 
     except Exception as e:
         print(f"❌ Memory commit failed: {e}")
@@ -5,10 +5,7 @@ This module contains templates and utilities for planning complex development
 projects that will be executed by teams of specialized AI agents.
 """
 
-
-def generate_project_breakdown_template():
-    """Template for breaking down large projects into manageable tasks"""
-    return """
+_BREAKDOWN_HEADER = """
 # Project Breakdown Template
 
 ## Overview
@@ -23,26 +20,42 @@ def generate_project_breakdown_template():
 - **Impact**: [Affected areas]
 
 ## Task Breakdown
-### Phase 1: Analysis
+"""
+
+_BREAKDOWN_PHASE_1 = """### Phase 1: Analysis
 - [ ] **Codebase Analysis** (Analyst) - Structure, dependencies, architecture
 - [ ] **Requirements** (Business Analyst) - Functional/non-functional requirements
+"""
 
-### Phase 2: Design
+_BREAKDOWN_PHASE_2 = """### Phase 2: Design
 - [ ] **System Design** (Architect) - Components, APIs, integration
 - [ ] **Database Design** (DB Specialist) - Schema, migrations, optimization
+"""
 
-### Phase 3: Implementation
+_BREAKDOWN_PHASE_3 = """### Phase 3: Implementation
 - [ ] **Backend** (Backend Dev) - APIs, business logic, data persistence
 - [ ] **Frontend** (Frontend Dev) - UI components, API integration
+"""
 
-### Phase 4: Quality
+_BREAKDOWN_PHASE_4 = """### Phase 4: Quality
 - [ ] **Testing** (Tester) - Unit/integration tests, coverage
 - [ ] **Review** (Reviewer) - Code quality, security, standards
+"""
 
-### Phase 5: Deployment
+_BREAKDOWN_PHASE_5 = """### Phase 5: Deployment
 - [ ] **DevOps** (DevOps) - Deployment scripts, monitoring
 - [ ] **Documentation** (Writer) - Technical docs, user guides
+"""
+
+_BREAKDOWN_PHASES = (
+    _BREAKDOWN_PHASE_1,
+    _BREAKDOWN_PHASE_2,
+    _BREAKDOWN_PHASE_3,
+    _BREAKDOWN_PHASE_4,
+    _BREAKDOWN_PHASE_5,
+)
 
+_BREAKDOWN_FOOTER = """
 ## Dependencies
 - [Task dependencies and parallel work]
 
@@ -62,10 +75,35 @@ def generate_project_breakdown_template():
 - **Escalation**: [Issue resolution process]
 """
 
+_ALL_PHASES = tuple(range(1, len(_BREAKDOWN_PHASES) + 1))
 
-def generate_team_structure_template():
-    """Template for defining multi-agent team structures"""
-    return """
+_PROJECT_BREAKDOWN_TEMPLATE = "".join(
+    (_BREAKDOWN_HEADER, "\n".join(_BREAKDOWN_PHASES), _BREAKDOWN_FOOTER)
+)
+
+
+def generate_project_breakdown_template(phases=_ALL_PHASES):
+    """Template for breaking down large projects into manageable tasks
+
+    ``phases`` selects which task-breakdown phases (1-5: analysis, design,
+    implementation, quality, deployment) are included, in the given order.
+    """
+    phases = tuple(phases)
+    if phases == _ALL_PHASES:
+        return _PROJECT_BREAKDOWN_TEMPLATE
+    for phase in phases:
+        if phase not in _ALL_PHASES:
+            raise ValueError(f"Unknown phase {phase!r}; expected one of {_ALL_PHASES}")
+    return "".join(
+        (
+            _BREAKDOWN_HEADER,
+            "\n".join(_BREAKDOWN_PHASES[phase - 1] for phase in phases),
+            _BREAKDOWN_FOOTER,
+        )
+    )
+
+
+_TEAM_STRUCTURE_TEMPLATE = """
 # Team Structure Template
 
 ## Core Team
@@ -97,6 +135,11 @@ def generate_team_structure_template():
 """
 
 
+def generate_team_structure_template():
+    """Template for defining multi-agent team structures"""
+    return _TEAM_STRUCTURE_TEMPLATE
+
+
 def generate_parallel_divergent_strategy():
     """Template for parallel divergent development strategy"""
     return """
@@ -1036,9 +1079,7 @@ Quality gates are checkpoints in the development process that ensure deliverable
 """
 
 
-def generate_workflow_template():
-    """Template for defining agent workflows and coordination"""
-    return """
+_WORKFLOW_TEMPLATE = """
 # Workflow Template
 
 ## Phases
@@ -1059,3 +1100,8 @@ def generate_workflow_template():
 - Timeline delays → adjust priorities
 - Technical blockers → escalate to architect
 """
+
+
+def generate_workflow_template():
+    """Template for defining agent workflows and coordination"""
+    return _WORKFLOW_TEMPLATE
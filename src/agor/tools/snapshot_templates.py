@@ -6,12 +6,120 @@ with complete context, including problem definition, progress made, commits, and
 """
 
 import datetime
+import os
 from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
 from typing import Dict, List
 
 from agor.tools.git_operations import run_git_command
 
+# Reading list and coordination fallbacks shared by the report snapshots,
+# filled in once per report kind rather than repeated in every template
+_SNAPSHOT_ORIENTATION_TEMPLATE = """\
+📘 **If you're unfamiliar with {report_kind}, read the following before proceeding:**
+- `src/agor/tools/SNAPSHOT_SYSTEM_GUIDE.md`
+- `src/agor/tools/AGOR_INSTRUCTIONS.md`
+- `src/agor/tools/README_ai.md`
+- `src/agor/tools/agent-start-here.md`
+
+📎 **If coordination files are missing or incomplete, you may need to:**
+- Confirm you're in a valid Git repo with AGOR coordination
+- Use `src/agor/memory_sync.py` to sync coordination state
+- Check `.agor/agentconvo.md` for recent agent communication"""
+
+_ORIENTATION_COMPLETION_REPORT = _SNAPSHOT_ORIENTATION_TEMPLATE.format(
+    report_kind="task completion reports"
+)
+_ORIENTATION_PROGRESS_REPORT = _SNAPSHOT_ORIENTATION_TEMPLATE.format(
+    report_kind="progress reports"
+)
+_ORIENTATION_WORK_ORDER = _SNAPSHOT_ORIENTATION_TEMPLATE.format(
+    report_kind="work orders"
+)
+_ORIENTATION_PR_DESCRIPTION = _SNAPSHOT_ORIENTATION_TEMPLATE.format(
+    report_kind="PR descriptions"
+)
+
+
+# C-style escapes git uses when quoting a path (core.quotePath)
+_GIT_PATH_ESCAPES = {
+    7: "\\a",
+    8: "\\b",
+    9: "\\t",
+    10: "\\n",
+    11: "\\v",
+    12: "\\f",
+    13: "\\r",
+    34: '\\"',
+    92: "\\\\",
+}
+
+
+def _quote_git_path(path: str, quote_space: bool) -> str:
+    """
+    Quote a path the way git prints it without -z.
+
+    `status --porcelain` also quotes paths containing spaces;
+    `diff --name-only` does not.
+    """
+    raw = path.encode("utf-8", "surrogateescape")
+    if not any(
+        byte < 0x20 or byte >= 0x7F or byte in (34, 92) or (quote_space and byte == 32)
+        for byte in raw
+    ):
+        return path
+    quoted = []
+    for byte in raw:
+        if byte in _GIT_PATH_ESCAPES:
+            quoted.append(_GIT_PATH_ESCAPES[byte])
+        elif byte < 0x20 or byte >= 0x7F:
+            quoted.append(f"\\{byte:03o}")
+        else:
+            quoted.append(chr(byte))
+    return "".join(['"', *quoted, '"'])
+
+
+def _parse_porcelain_status(status_out: str, context: Dict[str, str]) -> None:
+    """Fill branch, status and changed-file lists from porcelain -z output."""
+    records = status_out.split("\0")
+    if records and records[0].startswith("## "):
+        header = records.pop(0)[3:]
+        for prefix in ("No commits yet on ", "Initial commit on "):
+            if header.startswith(prefix):
+                header = header[len(prefix) :]
+        # Detached HEAD reports as "HEAD (no branch)"; branch --show-current
+        # prints nothing there
+        if header.startswith("HEAD (no branch)"):
+            context["branch"] = ""
+        else:
+            context["branch"] = header.split("...", 1)[0].split(" [", 1)[0]
+
+    lines = []
+    records_iter = iter(records)
+    for record in records_iter:
+        if not record:
+            continue
+        staged, unstaged, path = record[0], record[1], record[3:]
+        # -z prints renames and copies as "XY new" followed by an "old" record
+        if staged in "RC" or unstaged in "RC":
+            old_path = next(records_iter, "")
+            lines.append(
+                f"{staged}{unstaged} {_quote_git_path(old_path, True)}"
+                f" -> {_quote_git_path(path, True)}"
+            )
+        else:
+            lines.append(f"{staged}{unstaged} {_quote_git_path(path, True)}")
+        if staged in "?!":
+            continue
+        # Listed like diff --name-only: new path for renames, spaces unquoted
+        name = _quote_git_path(path, False)
+        if unstaged != " ":
+            context["uncommitted_changes"].append(name)
+        if staged != " ":
+            context["staged_changes"].append(name)
+
+    context["status"] = "\n".join(lines).strip()
+
 
 def get_git_context() -> Dict[str, str]:
     """Get current git context including branch, status, and recent commits."""
@@ -24,15 +132,14 @@ def get_git_context() -> Dict[str, str]:
         "staged_changes": [],
     }
     try:
-        # Get current branch
-        success, branch_out = run_git_command(["branch", "--show-current"])
-        if success:
-            context["branch"] = branch_out.strip()
-
-        # Get git status
-        success, status_out = run_git_command(["status", "--porcelain"])
+        # Branch, status, and unstaged/staged file lists all come from one
+        # status call; optional locks are skipped so the index isn't rewritten
+        success, status_out = run_git_command(
+            ["status", "--porcelain", "--branch", "-z"],
+            env={**os.environ, "GIT_OPTIONAL_LOCKS": "0"},
+        )
         if success:
-            context["status"] = status_out.strip()
+            _parse_porcelain_status(status_out, context)
 
         # Get recent commits
         success, commits_out = run_git_command(["log", "--oneline", "-10"])
@@ -44,20 +151,6 @@ def get_git_context() -> Dict[str, str]:
         if success:
             context["current_commit"] = commit_hash_out.strip()
 
-        # Get uncommitted changes
-        success, uncommitted_out = run_git_command(["diff", "--name-only"])
-        if success:
-            context["uncommitted_changes"] = (
-                uncommitted_out.strip().split("\n") if uncommitted_out.strip() else []
-            )
-
-        # Get staged changes
-        success, staged_out = run_git_command(["diff", "--cached", "--name-only"])
-        if success:
-            context["staged_changes"] = (
-                staged_out.strip().split("\n") if staged_out.strip() else []
-            )
-
         return context
     except Exception:  # Broad exception to catch any issue during git operations
         return {
@@ -422,7 +515,8 @@ def update_snapshot_index(filename: str, problem_summary: str, status: str):
     if not index_file.exists():
         create_snapshot_directory()  # Ensures directory and index exist
 
-    content = index_file.read_text()
+    original_content = index_file.read_text(encoding="utf-8")
+    content = original_content
 
     if status == "active":
         # Add to active snapshots
@@ -450,7 +544,17 @@ def update_snapshot_index(filename: str, problem_summary: str, status: str):
                 f"## Completed/Archived Snapshots\n- `{filename}` - {problem_summary}\n",
             )
 
-    index_file.write_text(content)
+    if content != original_content:
+        _replace_file_contents(index_file, content)
+
+
+def _replace_file_contents(path: Path, content: str) -> None:
+    """Atomically replace path's contents, keeping its permissions."""
+    from agor.utils import replace_atomically  # Deferred: pulls in settings
+
+    with replace_atomically(path) as tmp_path:
+        with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+            f.write(content)
 
 
 def generate_completion_report(
@@ -511,16 +615,7 @@ Task completion report for: {original_task}
 ## Task Status
 {final_status}
 
-📘 **If you're unfamiliar with task completion reports, read the following before proceeding:**
-- `src/agor/tools/SNAPSHOT_SYSTEM_GUIDE.md`
-- `src/agor/tools/AGOR_INSTRUCTIONS.md`
-- `src/agor/tools/README_ai.md`
-- `src/agor/tools/agent-start-here.md`
-
-📎 **If coordination files are missing or incomplete, you may need to:**
-- Confirm you're in a valid Git repo with AGOR coordination
-- Use `src/agor/memory_sync.py` to sync coordination state
-- Check `.agor/agentconvo.md` for recent agent communication
+{_ORIENTATION_COMPLETION_REPORT}
 
 ## Original Task
 {original_task}
@@ -674,16 +769,7 @@ agor/mem/{timestamp.replace(' ', 'T').replace(':', '')[:13]}
 ## Context
 Progress report for: {current_task}
 
-📘 **If you're unfamiliar with progress reports, read the following before proceeding:**
-- `src/agor/tools/SNAPSHOT_SYSTEM_GUIDE.md`
-- `src/agor/tools/AGOR_INSTRUCTIONS.md`
-- `src/agor/tools/README_ai.md`
-- `src/agor/tools/agent-start-here.md`
-
-📎 **If coordination files are missing or incomplete, you may need to:**
-- Confirm you're in a valid Git repo with AGOR coordination
-- Use `src/agor/memory_sync.py` to sync coordination state
-- Check `.agor/agentconvo.md` for recent agent communication
+{_ORIENTATION_PROGRESS_REPORT}
 
 ## 🎯 Current Task
 
@@ -773,16 +859,7 @@ Work order assignment: {task_description}
 ## Priority
 {priority_level}
 
-📘 **If you're unfamiliar with work orders, read the following before proceeding:**
-- `src/agor/tools/SNAPSHOT_SYSTEM_GUIDE.md`
-- `src/agor/tools/AGOR_INSTRUCTIONS.md`
-- `src/agor/tools/README_ai.md`
-- `src/agor/tools/agent-start-here.md`
-
-📎 **If coordination files are missing or incomplete, you may need to:**
-- Confirm you're in a valid Git repo with AGOR coordination
-- Use `src/agor/memory_sync.py` to sync coordination state
-- Check `.agor/agentconvo.md` for recent agent communication
+{_ORIENTATION_WORK_ORDER}
 
 ## Task Description
 {task_description}
@@ -866,16 +943,7 @@ PR description for: {pr_title}
 ## Target Branch
 {target_branch}
 
-📘 **If you're unfamiliar with PR descriptions, read the following before proceeding:**
-- `src/agor/tools/SNAPSHOT_SYSTEM_GUIDE.md`
-- `src/agor/tools/AGOR_INSTRUCTIONS.md`
-- `src/agor/tools/README_ai.md`
-- `src/agor/tools/agent-start-here.md`
-
-📎 **If coordination files are missing or incomplete, you may need to:**
-- Confirm you're in a valid Git repo with AGOR coordination
-- Use `src/agor/memory_sync.py` to sync coordination state
-- Check `.agor/agentconvo.md` for recent agent communication
+{_ORIENTATION_PR_DESCRIPTION}
 
 ## Pull Request Description (Copy & Paste)
 
@@ -13,11 +13,8 @@ All functions use absolute imports for better reliability.
 from dataclasses import dataclass
 from pathlib import Path
 
-from agor.tools.agent_prompts import detick_content
-from agor.tools.dev_testing import (
-    detect_environment,
-    get_agent_dependency_install_commands,
-)
+from agor.tools.agent_prompts import generate_agent_handoff_prompt_extended
+from agor.tools.dev_testing import detect_environment
 
 # Use absolute imports to prevent E0402 errors
 from agor.tools.git_operations import (
@@ -28,17 +25,29 @@ from agor.tools.git_operations import (
 from agor.tools.memory_manager import commit_to_memory_branch
 from agor.tools.snapshot_templates import generate_snapshot_document
 
+# Role menu for handoff prompts generated from snapshots; the rest of the
+# prompt is shared with agent_prompts.generate_agent_handoff_prompt_extended
+_HANDOFF_ROLE_OPTIONS = """\
+- SOLO DEVELOPER: Code analysis, implementation, technical work
+- PROJECT COORDINATOR: Planning and multi-agent coordination
+- AGENT WORKER: Task execution and following instructions
+"""
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HandoffRequest:
-    """Configuration object for handoff operations to reduce parameter count."""
+    """Configuration object for handoff operations to reduce parameter count.
+
+    Instances are immutable and hashable, so they can be shared or used as
+    cache keys; use dataclasses.replace() to derive a modified request.
+    """
 
     task_description: str
-    work_completed: list = None
-    next_steps: list = None
-    files_modified: list = None
-    context_notes: str = None
-    brief_context: str = None
+    work_completed: tuple = ()
+    next_steps: tuple = ()
+    files_modified: tuple = ()
+    context_notes: str = ""
+    brief_context: str = ""
     pr_title: str = None
     pr_description: str = None
     release_notes: str = None
@@ -50,20 +59,18 @@ class HandoffRequest:
 
     def __post_init__(self):
         """
-        Ensures all optional fields are initialized to empty lists or strings if not provided.
+        Normalizes optional fields so every instance is immutable and hashable.
 
-        This method sets default empty values for fields that may be None after dataclass initialization, preventing issues with mutable defaults.
+        List fields given as None or as lists are stored as tuples, and None
+        notes become empty strings.
         """
-        if self.work_completed is None:
-            self.work_completed = []
-        if self.next_steps is None:
-            self.next_steps = []
-        if self.files_modified is None:
-            self.files_modified = []
-        if self.context_notes is None:
-            self.context_notes = ""
-        if self.brief_context is None:
-            self.brief_context = ""
+        for name in ("work_completed", "next_steps", "files_modified"):
+            value = getattr(self, name)
+            if value is None or isinstance(value, list):
+                object.__setattr__(self, name, tuple(value or ()))
+        for name in ("context_notes", "brief_context"):
+            if getattr(self, name) is None:
+                object.__setattr__(self, name, "")
 
 
 def create_snapshot(
@@ -213,92 +220,14 @@ def generate_agent_handoff_prompt(
     Returns:
         A processed prompt string ready for use in a single codeblock.
     """
-    if environment is None:
-        environment = detect_environment()
-
-    timestamp = get_current_timestamp()
-
-    # Start building the prompt
-    prompt = f"""# 🤖 AGOR Agent Handoff
-
-**Generated**: {timestamp}
-**Environment**: {environment.get('mode', 'unknown')} ({environment.get('platform', 'unknown')})
-**AGOR Version**: {environment.get('agor_version', 'unknown')}
-"""
-
-    # Add memory branch information if available
-    if memory_branch:
-        prompt += f"""**Memory Branch**: {memory_branch}
-"""
-
-    prompt += f"""
-## Task Overview
-{task_description}
-"""
-
-    # Add brief context if provided
-    if brief_context:
-        prompt += f"""
-## Quick Context
-{brief_context}
-"""
-
-    # Add environment-specific setup
-    prompt += f"""
-## Environment Setup
-{get_agent_dependency_install_commands()}
-
-## AGOR Initialization
-Read these files to understand the system:
-- src/agor/tools/README_ai.md (role selection and initialization)
-- src/agor/tools/AGOR_INSTRUCTIONS.md (operational guide)
-- src/agor/tools/index.md (documentation index)
-
-Select appropriate role:
-- SOLO DEVELOPER: Code analysis, implementation, technical work
-- PROJECT COORDINATOR: Planning and multi-agent coordination
-- AGENT WORKER: Task execution and following instructions
-"""
-
-    # Add memory branch access if applicable
-    if memory_branch:
-        prompt += f"""
-## Memory Branch Access
-Your coordination files are stored on memory branch: {memory_branch}
-
-Access previous work context:
-```bash
-# View memory branch contents
-git show {memory_branch}:.agor/
-git show {memory_branch}:.agor/snapshots/
-```
-"""
-
-    # Add snapshot content if provided
-    if snapshot_content:
-        prompt += f"""
-## Previous Work Context
-{snapshot_content}
-"""
-
-    prompt += """
-## Getting Started
-1. Initialize your environment using the setup commands above
-2. Read the AGOR documentation files
-3. Select your role based on the task requirements
-4. Review any previous work context provided
-5. Begin work following AGOR protocols
-
-Remember: Always create a snapshot before ending your session using the dev tools.
-
----
-*This handoff prompt was generated automatically with environment detection and backtick processing*
-"""
-
-    # Apply backtick processing to prevent formatting issues
-    processed_prompt = detick_content(prompt)
-
-    return processed_prompt
+    return generate_agent_handoff_prompt_extended(
+        task_description=task_description,
+        snapshot_content=snapshot_content,
+        memory_branch=memory_branch,
+        environment=environment,
+        brief_context=brief_context,
+        role_options=_HANDOFF_ROLE_OPTIONS,
+    )
 
 
 def create_seamless_handoff(
@@ -449,6 +378,14 @@ def generate_handoff_snapshot(
     return snapshot_content
 
 
+# Fixed follow-up list used by every session end snapshot
+_SESSION_END_NEXT_STEPS = (
+    "1. Review session output and any artifacts created\n"
+    "2. Validate session completion\n"
+    "3. Continue with follow-up tasks"
+)
+
+
 def generate_mandatory_session_end_prompt(
     task_description: str = "Session completion",
     brief_context: str = "Work session completed",
@@ -462,7 +399,7 @@ def generate_mandatory_session_end_prompt(
     snapshot_content = generate_handoff_snapshot(
         task_description=task_description,
         work_completed=f"Completed session: {task_description}",
-        next_steps="1. Review session output and any artifacts created\n2. Validate session completion\n3. Continue with follow-up tasks",
+        next_steps=_SESSION_END_NEXT_STEPS,
         context_notes=brief_context,
     )
 
@@ -25,7 +25,9 @@ def manage_team(
         import os
         import sys
 
-        sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+        tools_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+        if tools_dir not in sys.path:
+            sys.path.append(tools_dir)
         from project_planning_templates import generate_team_management_template
 
     # Get the base template
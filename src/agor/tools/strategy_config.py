@@ -310,8 +310,7 @@ class StrategyConfigManager:
         # Save default configuration
         # Ensure parent directory exists
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.config_path, "w") as f:
-            json.dump(default_config, f, indent=2)
+        self.config_path.write_text(json.dumps(default_config, indent=2))
 
         # Parse the default configuration
         self._parse_configurations(default_config)
@@ -13,11 +13,17 @@ Key Features:
 
 import datetime
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 try:
-    from jinja2 import Environment, FileSystemLoader, select_autoescape
+    from jinja2 import (
+        Environment,
+        FileSystemBytecodeCache,
+        FileSystemLoader,
+        select_autoescape,
+    )
 
     JINJA2_AVAILABLE = True
 except ImportError:
@@ -25,6 +31,23 @@ except ImportError:
     print("⚠️ Jinja2 not available. Install with: pip install jinja2")
 
 
+def _bytecode_cache() -> Optional["FileSystemBytecodeCache"]:
+    """
+    Return an on-disk cache for compiled templates, or None if unavailable.
+
+    Compiled template bytecode is kept under the user cache directory so
+    later runs skip parsing and compiling the templates again.
+    """
+    try:
+        import platformdirs
+
+        cache_dir = Path(platformdirs.user_cache_dir("agor")) / "jinja"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except (ImportError, OSError):
+        return None
+    return FileSystemBytecodeCache(str(cache_dir))
+
+
 class TemplateEngine:
     """
     Jinja2-based template engine for AGOR content generation.
@@ -49,6 +72,7 @@ class TemplateEngine:
                 autoescape=select_autoescape(["html", "xml"]),
                 trim_blocks=True,
                 lstrip_blocks=True,
+                bytecode_cache=_bytecode_cache(),
             )
             self._register_custom_filters()
             self._register_custom_functions()
@@ -488,20 +512,23 @@ Task completion report for: {{ original_task }}
 {{ additional_notes | default('None') }}"""
 
 
+@lru_cache(maxsize=1)
+def _default_engine() -> TemplateEngine:
+    """Return the shared engine so its compiled templates are reused."""
+    return TemplateEngine()
+
+
 # Convenience functions for backward compatibility
 def render_snapshot_template(context: Dict[str, Any]) -> str:
     """Render snapshot template with given context."""
-    engine = TemplateEngine()
-    return engine.render_template("snapshot.md.j2", context)
+    return _default_engine().render_template("snapshot.md.j2", context)
 
 
 def render_handoff_template(context: Dict[str, Any]) -> str:
     """Render handoff prompt template with given context."""
-    engine = TemplateEngine()
-    return engine.render_template("handoff_prompt.md.j2", context)
+    return _default_engine().render_template("handoff_prompt.md.j2", context)
 
 
 def render_completion_template(context: Dict[str, Any]) -> str:
     """Render completion report template with given context."""
-    engine = TemplateEngine()
-    return engine.render_template("completion_report.md.j2", context)
+    return _default_engine().render_template("completion_report.md.j2", context)
@@ -1,21 +1,27 @@
 import hashlib
 import os
 import shutil
+import subprocess
+import sys
 import tarfile
+import tempfile
 import zipfile
+from contextlib import contextmanager, nullcontext
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
-import httpx
 from tqdm import tqdm
 
 from .constants import (
     DOWNLOAD_CHUNK_SIZE,
     PROGRESS_BAR_WIDTH,
+    SENDFILE_CHUNK_SIZE,
     SUPPORTED_COMPRESSION_FORMATS,
+    TAR_COPY_BUFFER_SIZE,
 )
 from .exceptions import CompressionError, NetworkError
-from .settings import settings
+from .platform import which
+from .settings import get_settings
 
 
 def sanitize_slug(input_string: str) -> str:
@@ -35,15 +41,12 @@ def sanitize_slug(input_string: str) -> str:
     if not input_string:
         return "unknown"
 
-    # Remove or replace unsafe characters
-    # Keep only alphanumerics, dashes, and underscores
-    sanitized = re.sub(r"[^a-zA-Z0-9\-_]", "_", str(input_string))
+    # Keep only alphanumerics: in a single pass, collapse each run of
+    # dashes, underscores and unsafe characters into one underscore
+    sanitized = re.sub(r"[^a-zA-Z0-9]+", "_", str(input_string))
 
-    # Remove multiple consecutive underscores/dashes
-    sanitized = re.sub(r"[_\-]+", "_", sanitized)
-
-    # Remove leading/trailing underscores/dashes
-    sanitized = sanitized.strip("_-")
+    # Remove leading/trailing underscores
+    sanitized = sanitized.strip("_")
 
     # Ensure it's not empty and not too long
     if not sanitized:
@@ -54,27 +57,115 @@ def sanitize_slug(input_string: str) -> str:
     return sanitized
 
 
+def write_stdout(text: str) -> None:
+    """
+    Write a large block of text to stdout in a single call.
+
+    The text is encoded once and handed to the underlying binary buffer,
+    skipping the per-call work of the text layer. Falls back to a plain
+    text write when stdout has no buffer (e.g. a replaced stream) or when
+    the platform translates newlines.
+
+    Args:
+        text: Text to write, including any trailing newline
+    """
+    stream = sys.stdout
+    buffer = getattr(stream, "buffer", None)
+    if buffer is None or os.linesep != "\n":
+        stream.write(text)
+        stream.flush()
+        return
+
+    # Keep ordering with anything already queued in the text layer
+    stream.flush()
+    buffer.write(text.encode(stream.encoding or "utf-8", stream.errors or "strict"))
+    buffer.flush()
+
+
 def move_directory(src_dir: Path, dest_dir: Path):
+    # A single rename moves the whole tree when dest_dir is absent (or an
+    # empty directory) on the same filesystem
+    try:
+        os.rename(src_dir, dest_dir)
+        return dest_dir
+    except OSError:
+        pass  # Cross-device or non-empty destination; move entry by entry
+
     dest_dir.mkdir(
         parents=True, exist_ok=True
     )  # Ensures that the destination directory exists
 
-    for item in src_dir.iterdir():
-        shutil.move(str(item), str(dest_dir))
+    with os.scandir(src_dir) as entries:
+        for entry in entries:
+            target = os.path.join(dest_dir, entry.name)
+            try:
+                os.rename(entry.path, target)
+            except OSError:
+                # EXDEV: shutil.move copies (via scandir-based copytree) and
+                # removes the source
+                shutil.move(entry.path, target)
 
     return dest_dir
 
 
+@contextmanager
+def replace_atomically(path: Path, suffix: str = ".tmp") -> Iterator[Path]:
+    """
+    Yield a temp file next to path, then rename it over path on success.
+
+    The temp file is created exclusively with mkstemp, so concurrent writers
+    never share it, and is removed if the block raises. mkstemp files are
+    0600, so before the rename the file gets path's current mode, or the
+    usual umask permissions when path doesn't exist yet.
+    """
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=suffix
+    )
+    os.close(fd)
+    tmp_path = Path(tmp_name)
+    try:
+        yield tmp_path
+        try:
+            mode = path.stat().st_mode & 0o7777
+        except FileNotFoundError:
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+        tmp_path.chmod(mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 def download_file(
-    url: str, dest_path: Path, expected_sha256: Optional[str] = None
+    url: str,
+    dest_path: Path,
+    expected_sha256: Optional[str] = None,
+    etag_path: Optional[Path] = None,
+    tee_path: Optional[Path] = None,
+    show_progress: bool = True,
 ) -> Path:
     """
     Download a file from URL with progress bar and optional integrity checking.
 
+    When etag_path is given the response's ETag is stored there, and if
+    dest_path already exists the request is made conditional on it with
+    If-None-Match. A 304 Not Modified leaves dest_path untouched. The body is
+    written to a sibling temp file and renamed into place, so a failed
+    refresh never clobbers a good copy.
+
+    tee_path receives a second copy of the body from the same read loop,
+    saving a later copy when the file is wanted in two places. It is not
+    written when the server answers 304.
+
     Args:
         url: URL to download from
         dest_path: Path to save the downloaded file
         expected_sha256: Optional SHA256 hash for integrity verification
+        etag_path: Optional sidecar file used to store and send the ETag
+        tee_path: Optional second path to write the downloaded body to
+        show_progress: Draw a progress bar (off for background downloads)
 
     Returns:
         Path to the downloaded file
@@ -83,8 +174,21 @@ def download_file(
         NetworkError: If download fails
         CompressionError: If integrity check fails
     """
+    import httpx  # Deferred: httpx dominates agor's import time
+
+    headers = {}
+    if etag_path is not None and dest_path.exists() and etag_path.exists():
+        headers["If-None-Match"] = etag_path.read_text().strip()
+
+    part_path = dest_path.with_name(dest_path.name + ".download")
+    completed = False
+    tee_opened = False  # Only a tee file this call created may be removed
     try:
-        with httpx.stream("GET", url, follow_redirects=True) as response:
+        with httpx.stream(
+            "GET", url, headers=headers, follow_redirects=True
+        ) as response:
+            if response.status_code == 304:
+                return dest_path
             response.raise_for_status()
             total_size = int(response.headers.get("content-length", 0))
 
@@ -94,36 +198,60 @@ def download_file(
                 unit="iB",
                 unit_scale=True,
                 ncols=PROGRESS_BAR_WIDTH,
+                disable=not show_progress,
             )
 
             sha256_hash = hashlib.sha256() if expected_sha256 else None
-
-            with open(dest_path, "wb") as f:
+            received = 0  # Counted here: a disabled tqdm doesn't track t.n
+
+            if tee_path is not None:
+                tee_file = open(tee_path, "wb")
+                tee_opened = True
+            else:
+                tee_file = nullcontext()
+            with tee_file as tee, open(part_path, "wb") as f:
                 for chunk in response.iter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    received += len(chunk)
                     t.update(len(chunk))
                     f.write(chunk)
+                    if tee is not None:
+                        tee.write(chunk)
                     if sha256_hash:
                         sha256_hash.update(chunk)
             t.close()
 
-            if total_size != 0 and t.n != total_size:
+            if total_size != 0 and received != total_size:
                 raise NetworkError(
-                    f"Download incomplete: expected {total_size} bytes, got {t.n}"
+                    f"Download incomplete: expected {total_size} bytes, "
+                    f"got {received}"
                 )
 
             # Verify integrity if expected hash provided
             if expected_sha256 and sha256_hash:
                 actual_hash = sha256_hash.hexdigest()
                 if actual_hash != expected_sha256:
-                    dest_path.unlink(missing_ok=True)  # Remove corrupted file
                     raise CompressionError(
                         f"File integrity check failed. Expected: {expected_sha256}, got: {actual_hash}"
                     )
 
+            os.replace(part_path, dest_path)
+            completed = True
+
+            if etag_path is not None:
+                etag = response.headers.get("ETag")
+                if etag:
+                    etag_path.write_text(etag)
+                else:
+                    etag_path.unlink(missing_ok=True)
+
     except httpx.HTTPError as e:
         raise NetworkError(f"Failed to download {url}: {e}") from e
     except OSError as e:
         raise NetworkError(f"Failed to save file to {dest_path}: {e}") from e
+    finally:
+        part_path.unlink(missing_ok=True)  # Incomplete or corrupted download
+        if tee_opened and not completed:
+            tee_path.unlink(missing_ok=True)
 
     return dest_path
 
@@ -150,7 +278,7 @@ def create_archive(
     """
     # Use default compression format if none provided
     if compression is None:
-        compression = settings.compression_format
+        compression = get_settings().compression_format
 
     # Ensure the directory exists
     if not dir_to_compress.exists() or not dir_to_compress.is_dir():
@@ -220,32 +348,89 @@ def _create_zip_archive(
     return archive_path
 
 
+# Multi-threaded drop-in replacements for the stdlib compressors, tried in order.
+# They emit the same gzip/bzip2 streams, so the archive format is unchanged.
+PARALLEL_COMPRESSORS = {
+    "gz": ("pigz",),
+    "bz2": ("lbzip2", "pbzip2"),
+}
+
+
+def _find_parallel_compressor(compression: str) -> Optional[str]:
+    """Return the path of a parallel compressor for the format, if installed."""
+    for name in PARALLEL_COMPRESSORS.get(compression, ()):
+        path = which(name)
+        if path:
+            return path
+    return None
+
+
 def _create_tar_archive(
     dir_to_compress: Path, archive_path: Path, compression: str, total_files: int
 ) -> Path:
-    """Create a TAR archive with specified compression."""
-    files_added = 0
-    with tarfile.open(archive_path, f"w:{compression}") as tar:
-        with tqdm(
-            total=total_files,
-            desc=f"📦 Creating TAR.{compression.upper()} archive",
-            ncols=PROGRESS_BAR_WIDTH,
-            unit="file",
-        ) as pbar:
-            for root, _dirs, files in os.walk(dir_to_compress):
-                for file in files:
-                    absolute_file_path = os.path.join(root, file)
-                    relative_file_path = os.path.relpath(
-                        absolute_file_path, dir_to_compress
+    """Create a TAR archive with specified compression.
+
+    When a parallel compressor (pigz, lbzip2, pbzip2) is on PATH the tar
+    stream is piped through it so compression uses every core; otherwise
+    tarfile's single-threaded compressor is used.
+    """
+    compressor = _find_parallel_compressor(compression)
+    if compressor is None:
+        # A larger copy buffer cuts the number of read/compress/write round trips
+        # per member, which dominates for the multi-megabyte git binary.
+        with tarfile.open(
+            archive_path, f"w:{compression}", copybufsize=TAR_COPY_BUFFER_SIZE
+        ) as tar:
+            files_added = _add_tree_to_tar(
+                tar, dir_to_compress, compression, total_files
+            )
+    else:
+        with open(archive_path, "wb") as out:
+            proc = subprocess.Popen(
+                [compressor, "-c"], stdin=subprocess.PIPE, stdout=out
+            )
+            try:
+                with tarfile.open(
+                    fileobj=proc.stdin, mode="w|", copybufsize=TAR_COPY_BUFFER_SIZE
+                ) as tar:
+                    files_added = _add_tree_to_tar(
+                        tar, dir_to_compress, compression, total_files
                     )
-                    tar.add(absolute_file_path, arcname=relative_file_path)
-                    files_added += 1
-                    pbar.update()
+            finally:
+                proc.stdin.close()
+                returncode = proc.wait()
+        if returncode != 0:
+            raise CompressionError(
+                f"{Path(compressor).name} exited with status {returncode}"
+            )
 
     print(f"✅ TAR.{compression.upper()} archive created: {files_added} files added")
     return archive_path
 
 
+def _add_tree_to_tar(
+    tar: tarfile.TarFile, dir_to_compress: Path, compression: str, total_files: int
+) -> int:
+    """Add every file under dir_to_compress to tar, returning the file count."""
+    files_added = 0
+    with tqdm(
+        total=total_files,
+        desc=f"📦 Creating TAR.{compression.upper()} archive",
+        ncols=PROGRESS_BAR_WIDTH,
+        unit="file",
+    ) as pbar:
+        for root, _dirs, files in os.walk(dir_to_compress):
+            for file in files:
+                absolute_file_path = os.path.join(root, file)
+                relative_file_path = os.path.relpath(
+                    absolute_file_path, dir_to_compress
+                )
+                tar.add(absolute_file_path, arcname=relative_file_path)
+                files_added += 1
+                pbar.update()
+    return files_added
+
+
 def verify_archive_contents(archive_path: Path) -> dict:
     """Verify archive contents and return statistics."""
     archive_path = Path(archive_path)
@@ -312,3 +497,68 @@ def move_file(src_file: Path, dest_dir: Path) -> Path:
     destination = dest_dir / src_file.name
     shutil.move(str(src_file), str(destination))
     return destination
+
+
+def fast_copy_file(src_file: Path, dest_file: Path) -> Path:
+    """
+    Copy a file without staging its contents through user space.
+
+    Hardlinks when source and destination share a filesystem. If linking is
+    refused (e.g. fs.protected_hardlinks on files owned by another user) a
+    copy-on-write reflink is tried, as ``cp --reflink=auto`` does; otherwise
+    the data is streamed in-kernel with os.sendfile. Falls back to
+    shutil.copyfile where none of these are available.
+
+    Usable as a ``copy_function`` for shutil.copytree. Like shutil.copy2,
+    the copies keep the source's mode bits and timestamps.
+    """
+    try:
+        os.link(src_file, dest_file)
+        return dest_file
+    except OSError:
+        pass  # Cross-device (EXDEV) or links unsupported; copy the bytes instead
+
+    _copy_file_contents(src_file, dest_file)
+    shutil.copystat(src_file, dest_file)
+    return dest_file
+
+
+def _copy_file_contents(src_file: Path, dest_file: Path) -> None:
+    """Copy the bytes of src_file by reflink, sendfile or shutil.copyfile."""
+    if _reflink(src_file, dest_file):
+        return
+
+    if hasattr(os, "sendfile"):
+        try:
+            with open(src_file, "rb") as src, open(dest_file, "wb") as dst:
+                src_fd, dst_fd = src.fileno(), dst.fileno()
+                offset = 0
+                while True:
+                    sent = os.sendfile(dst_fd, src_fd, offset, SENDFILE_CHUNK_SIZE)
+                    if sent == 0:
+                        break
+                    offset += sent
+            return
+        except OSError:
+            pass  # Some filesystems reject sendfile; use the portable path
+
+    shutil.copyfile(src_file, dest_file)
+
+
+# ioctl request number for FICLONE on Linux (_IOW(0x94, 9, int))
+_FICLONE = 0x40049409
+
+
+def _reflink(src_file: Path, dest_file: Path) -> bool:
+    """Clone src_file into dest_file with FICLONE, returning True on success."""
+    try:
+        import fcntl
+    except ImportError:
+        return False  # Not a POSIX platform
+
+    try:
+        with open(src_file, "rb") as src, open(dest_file, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        return True
+    except OSError:
+        return False  # Not Linux, different filesystems, or no CoW support
@@ -164,16 +164,18 @@ def should_check_version() -> bool:
         # Use platformdirs for cache directory
         import platformdirs
 
-        cache_dir = Path(platformdirs.user_cache_dir("agor"))
-        cache_dir.mkdir(parents=True, exist_ok=True)
-
-        version_check_file = cache_dir / "last_version_check"
+        version_check_file = (
+            Path(platformdirs.user_cache_dir("agor")) / "last_version_check"
+        )
 
-        if not version_check_file.exists():
+        # One stat answers both "ever checked?" and "how long ago?"; the cache
+        # dir is only created when mark_version_checked() writes the marker
+        try:
+            last_check = version_check_file.stat().st_mtime
+        except FileNotFoundError:
             return True
 
         # Check if it's been more than 24 hours
-        last_check = version_check_file.stat().st_mtime
         return (time.time() - last_check) > 86400  # 24 hours
 
     except Exception:
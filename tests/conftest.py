@@ -2,6 +2,8 @@
 Pytest configuration and fixtures for AGOR tests.
 """
 
+import shutil
+import subprocess
 import tempfile
 from pathlib import Path
 
@@ -37,3 +39,38 @@ def sample_local_path(temp_dir):
     (repo_path / "src" / "main.py").write_text("print('Hello, World!')")
 
     return repo_path
+
+
+# Environment overrides that would point git at some other repository
+_GIT_LOCATION_ENV = (
+    "GIT_DIR",
+    "GIT_WORK_TREE",
+    "GIT_INDEX_FILE",
+    "GIT_OBJECT_DIRECTORY",
+)
+
+
+@pytest.fixture
+def git():
+    """Run git in the current directory and return its stdout (skips without git)."""
+    if shutil.which("git") is None:
+        pytest.skip("git not installed")
+
+    def run(*args):
+        return subprocess.run(
+            ["git", *args], check=True, capture_output=True, text=True
+        ).stdout
+
+    return run
+
+
+@pytest.fixture
+def git_repo(tmp_path, monkeypatch, git):
+    """An empty repository on an unborn main branch, used as the working directory."""
+    for name in _GIT_LOCATION_ENV:
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.chdir(tmp_path)
+    git("init", "-q", "-b", "main")
+    git("config", "user.email", "test@example.com")
+    git("config", "user.name", "Test")
+    return tmp_path
@@ -0,0 +1,112 @@
+"""
+Tests for the optional pygit2 path in git_operations.
+
+Each in-process answer is compared with what the git binary prints for the
+same command, so the two paths can't drift apart silently.
+"""
+
+import pytest
+
+from agor.tools.git_operations import _open_pygit2_repository, _run_git_in_process
+
+pygit2 = pytest.importorskip("pygit2")
+
+QUERIES = (
+    ["rev-parse", "HEAD"],
+    ["branch", "--show-current"],
+    ["status", "--porcelain"],
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_repository_cache():
+    """Don't let a Repository opened by one test answer for the next."""
+    _open_pygit2_repository.cache_clear()
+    yield
+    _open_pygit2_repository.cache_clear()
+
+
+@pytest.fixture
+def matches_git(git):
+    """Assert that pygit2 answers a query exactly as the git binary does."""
+
+    def check(command):
+        output = _run_git_in_process(command)
+        assert output is not None, f"{command} fell back to the git binary"
+        assert output == git(*command)
+
+    return check
+
+
+@pytest.fixture
+def committed_repo(git_repo, git):
+    """The shared git_repo with one commit of a few files."""
+    for name in ("kept", "modified", "deleted", "staged"):
+        (git_repo / name).write_text(name)
+    (git_repo / "pkg").mkdir()
+    (git_repo / "pkg" / "module.py").write_text("x = 1\n")
+    git("add", ".")
+    git("commit", "-q", "-m", "initial")
+    return git_repo
+
+
+def test_clean_repo(committed_repo, matches_git):
+    """A clean tree prints no status; HEAD and branch match git."""
+    for command in QUERIES:
+        matches_git(command)
+    assert _run_git_in_process(["status", "--porcelain"]) == ""
+
+
+def test_detached_head(committed_repo, git, matches_git):
+    """A detached HEAD has no current branch."""
+    git("checkout", "-q", "--detach")
+
+    for command in QUERIES:
+        matches_git(command)
+    assert _run_git_in_process(["branch", "--show-current"]) == ""
+
+
+def test_unborn_branch(git_repo, git, matches_git):
+    """Before the first commit the branch is known but HEAD isn't."""
+    (git_repo / "first").write_text("first")
+    git("add", "first")
+    (git_repo / "loose").write_text("loose")
+
+    matches_git(["branch", "--show-current"])
+    matches_git(["status", "--porcelain"])
+    # git itself fails here, so the query is left to it
+    assert _run_git_in_process(["rev-parse", "HEAD"]) is None
+
+
+def test_staged_modified_deleted_and_untracked(committed_repo, git, matches_git):
+    """Index and worktree changes come out in git's order and codes."""
+    (committed_repo / "modified").write_text("changed")
+    (committed_repo / "deleted").unlink()
+    (committed_repo / "staged").write_text("changed")
+    git("add", "staged")
+    (committed_repo / "staged").write_text("changed again")
+    (committed_repo / "added").write_text("added")
+    git("add", "added")
+    (committed_repo / "untracked").write_text("untracked")
+    (committed_repo / "newdir").mkdir()
+    (committed_repo / "newdir" / "file").write_text("untracked")
+
+    matches_git(["status", "--porcelain"])
+
+
+def test_subdirectory_cwd(committed_repo, monkeypatch, matches_git):
+    """Porcelain paths stay relative to the repository root from a subdirectory."""
+    (committed_repo / "modified").write_text("changed")
+    (committed_repo / "pkg" / "module.py").write_text("x = 2\n")
+    (committed_repo / "pkg" / "new.py").write_text("")
+    monkeypatch.chdir(committed_repo / "pkg")
+
+    for command in QUERIES:
+        matches_git(command)
+
+
+def test_unusual_paths_fall_back_to_git(committed_repo):
+    """Paths git would quote are left to the git binary."""
+    (committed_repo / "with space").write_text("untracked")
+
+    assert _run_git_in_process(["status", "--porcelain"]) is None
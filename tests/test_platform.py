@@ -0,0 +1,98 @@
+"""
+Tests for AGOR platform clipboard handling.
+"""
+
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from agor import platform as agor_platform
+
+
+@pytest.fixture
+def macos_clipboard():
+    """Pretend to be on macOS with pbcopy installed and pyperclip missing."""
+    with (
+        patch.object(agor_platform, "_load_pyperclip", return_value=None),
+        patch.object(agor_platform, "_clipboard_platform", return_value="macos"),
+        patch.object(
+            agor_platform,
+            "_clipboard_commands",
+            return_value=(("pbcopy", ("/usr/bin/pbcopy",), "utf-8"),),
+        ),
+    ):
+        yield
+
+
+class TestCopyToClipboard:
+    """Test the command-based clipboard fallbacks."""
+
+    def test_text_is_written_as_utf8_bytes(self, macos_clipboard):
+        """Test that commands receive UTF-8 bytes, not locale-encoded text."""
+        text = "Résumé → 🎼"
+        with patch.object(agor_platform.subprocess, "run") as mock_run:
+            success, message = agor_platform.copy_to_clipboard(text)
+
+        assert success
+        assert message == "📋 Copied to clipboard using pbcopy!"
+        args, kwargs = mock_run.call_args
+        assert args == (("/usr/bin/pbcopy",),)
+        assert kwargs["input"] == text.encode("utf-8")
+        assert "text" not in kwargs
+        assert not kwargs.get("shell", False)
+
+    def test_windows_commands_get_unicode_safe_input(self):
+        """Test that PowerShell reads UTF-8 and clip.exe gets UTF-16LE with a BOM."""
+        text = "Résumé → 🎼"
+        commands = {
+            label: (argv, encoding)
+            for label, argv, encoding in agor_platform._CLIPBOARD_COMMANDS["windows"]
+        }
+
+        powershell_argv, powershell_encoding = commands["PowerShell"]
+        assert powershell_argv[-1].startswith(
+            "[Console]::InputEncoding=[Text.Encoding]::UTF8;"
+        )
+        assert agor_platform._encode_clipboard_text(
+            text, powershell_encoding
+        ) == text.encode("utf-8")
+
+        _, clip_encoding = commands["clip.exe"]
+        data = agor_platform._encode_clipboard_text(text, clip_encoding)
+        assert data.startswith(b"\xff\xfe")
+        assert data[2:].decode("utf-16-le") == text
+
+    def test_falls_through_to_next_command(self):
+        """Test that a failing command falls back to the next candidate."""
+        commands = (
+            ("xclip", ("/usr/bin/xclip", "-selection", "clipboard"), "utf-8"),
+            ("wl-copy", ("/usr/bin/wl-copy",), "utf-8"),
+        )
+        with (
+            patch.object(agor_platform, "_load_pyperclip", return_value=None),
+            patch.object(agor_platform, "_clipboard_platform", return_value="linux"),
+            patch.object(agor_platform, "_clipboard_commands", return_value=commands),
+            patch.object(
+                agor_platform.subprocess,
+                "run",
+                side_effect=[subprocess.CalledProcessError(1, "xclip"), None],
+            ) as mock_run,
+        ):
+            success, message = agor_platform.copy_to_clipboard("hello")
+
+        assert success
+        assert message == "📋 Copied to clipboard using wl-copy!"
+        assert mock_run.call_count == 2
+
+    def test_no_commands_installed(self):
+        """Test the install hint when no clipboard command is available."""
+        with (
+            patch.object(agor_platform, "_load_pyperclip", return_value=None),
+            patch.object(agor_platform, "_clipboard_platform", return_value="linux"),
+            patch.object(agor_platform, "_clipboard_commands", return_value=()),
+        ):
+            success, message = agor_platform.copy_to_clipboard("hello")
+
+        assert not success
+        assert "xclip" in message
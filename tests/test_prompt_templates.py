@@ -0,0 +1,128 @@
+"""
+Tests for AGOR prompt and planning template modules.
+"""
+
+import ast
+from pathlib import Path
+
+import pytest
+
+from agor.tools import agent_prompt_templates as prompts
+from agor.tools.project_planning_templates import generate_project_breakdown_template
+
+TOOLS_DIR = Path(prompts.__file__).parent
+
+
+class TestTemplateAssemblyConvention:
+    """Template modules assemble strings with str.join, never with +."""
+
+    @pytest.mark.parametrize(
+        "path", sorted(TOOLS_DIR.glob("*_templates.py")), ids=lambda p: p.name
+    )
+    def test_no_string_concatenation_with_plus(self, path):
+        """Test that no + operand in a template module is a string literal."""
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+        offenders = []
+        for node in ast.walk(tree):
+            if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+                operands = (node.left, node.right)
+            elif isinstance(node, ast.AugAssign) and isinstance(node.op, ast.Add):
+                operands = (node.value,)
+            else:
+                continue
+            if any(
+                isinstance(operand, ast.JoinedStr)
+                or (
+                    isinstance(operand, ast.Constant) and isinstance(operand.value, str)
+                )
+                for operand in operands
+            ):
+                offenders.append(node.lineno)
+        assert not offenders, f"use str.join instead of + at lines {offenders}"
+
+
+class TestRolePrompts:
+    """Test the role prompt generators."""
+
+    def test_static_prefix_comes_first(self):
+        """Test that the static guidance leads the rendered prompt."""
+        prompt = prompts.generate_validation_prompt("code", "criteria", "context")
+        assert prompt.startswith(prompts._VALIDATION_PREFIX)
+        assert prompt.endswith("CONTEXT:\ncontext\n")
+
+    def test_iter_variants_match_generate(self):
+        """Test that iter_* yields the same text as generate_*."""
+        args = ("a", "b", "c")
+        for name in ("validation", "integration", "project_coordinator", "context"):
+            generate = getattr(prompts, f"generate_{name}_prompt")
+            iterate = getattr(prompts, f"iter_{name}_prompt")
+            assert "".join(iterate(*args)) == generate(*args)
+        assert "".join(prompts.iter_specialist_prompt("a", "b", "c", "d")) == (
+            prompts.generate_specialist_prompt("a", "b", "c", "d")
+        )
+
+    def test_terse_prompt_omits_guidance(self):
+        """Test that verbose=False drops the static guidance block."""
+        full = prompts.generate_integration_prompt("comp", "reqs", "ctx")
+        terse = prompts.generate_integration_prompt(
+            "comp", "reqs", "ctx", verbose=False
+        )
+        assert "Verify component compatibility" in full
+        assert "Verify component compatibility" not in terse
+        assert "COMPONENTS:\ncomp" in terse
+        assert len(terse) < len(full)
+
+    def test_context_prompt_is_memoized(self):
+        """Test that repeated context prompts reuse the cached render."""
+        prompts.clear_context_prompt_cache()
+        first = prompts.generate_context_prompt("code", "goals", "limits")
+        assert prompts.generate_context_prompt("code", "goals", "limits") is first
+        assert "goals" in prompts.generate_context_prompt(["code"], "goals", "limits")
+        prompts.clear_context_prompt_cache()
+        assert prompts.generate_context_prompt("code", "goals", "limits") is not first
+
+    def test_bytes_variants_match_encoded_text(self):
+        """Test that *_bytes variants return the UTF-8 encoded prompt."""
+        args = ("naïve", "b", "c")
+        for name in ("validation", "integration", "project_coordinator", "context"):
+            generate = getattr(prompts, f"generate_{name}_prompt")
+            as_bytes = getattr(prompts, f"generate_{name}_prompt_bytes")
+            assert as_bytes(*args) == generate(*args).encode("utf-8")
+        assert prompts.generate_snapshot_prompt_bytes("a", "b", "c", "d", "e") == (
+            prompts.generate_snapshot_prompt("a", "b", "c", "d", "e").encode("utf-8")
+        )
+
+    def test_prompt_spec_renders_once(self):
+        """Test that a prompt spec caches its rendered prompt."""
+        spec = prompts.IntegrationPromptSpec("comp", "reqs", "ctx", verbose=False)
+        rendered = spec.rendered
+        assert rendered == prompts.generate_integration_prompt(
+            "comp", "reqs", "ctx", verbose=False
+        )
+        assert spec.rendered is rendered
+        assert spec == prompts.IntegrationPromptSpec("comp", "reqs", "ctx", False)
+        assert not hasattr(spec, "__dict__")
+
+
+class TestProjectBreakdownTemplate:
+    """Test the project breakdown template phase selection."""
+
+    def test_all_phases_by_default(self):
+        """Test that the default template includes every phase."""
+        template = generate_project_breakdown_template()
+        assert template is generate_project_breakdown_template((1, 2, 3, 4, 5))
+        assert "### Phase 1: Analysis" in template
+        assert "### Phase 5: Deployment" in template
+
+    def test_phase_subset(self):
+        """Test selecting a subset of phases."""
+        template = generate_project_breakdown_template(phases=(1, 3))
+        assert "### Phase 1: Analysis" in template
+        assert "### Phase 3: Implementation" in template
+        assert "### Phase 2: Design" not in template
+        assert "## Dependencies" in template
+
+    def test_unknown_phase(self):
+        """Test that unknown phase numbers are rejected."""
+        with pytest.raises(ValueError):
+            generate_project_breakdown_template(phases=(6,))
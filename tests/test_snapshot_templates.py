@@ -0,0 +1,61 @@
+"""
+Tests for snapshot git context collection.
+"""
+
+import pytest
+
+from agor.tools.snapshot_templates import (
+    create_snapshot_directory,
+    get_git_context,
+    update_snapshot_index,
+)
+
+
+@pytest.fixture
+def committed_repo(git_repo, git):
+    """The shared git_repo with one commit of a few files."""
+    for name, content in (("b c.txt", "a"), ("old name.txt", "b"), ("plain", "c")):
+        (git_repo / name).write_text(content)
+    git("add", ".")
+    git("commit", "-q", "-m", "initial")
+    return git_repo
+
+
+def test_git_context_matches_separate_git_commands(committed_repo, git):
+    """Spaces and renames come out as status/diff --name-only print them."""
+    (committed_repo / "b c.txt").unlink()
+    git("mv", "old name.txt", "new name.txt")
+    (committed_repo / "plain").write_text("changed")
+    (committed_repo / "un tracked").write_text("new")
+
+    context = get_git_context()
+
+    assert context["branch"] == "main"
+    assert context["status"] == git("status", "--porcelain").strip()
+    assert context["uncommitted_changes"] == ["b c.txt", "plain"]
+    assert context["staged_changes"] == ["new name.txt"]
+    assert context["uncommitted_changes"] == git("diff", "--name-only").splitlines()
+    assert (
+        context["staged_changes"] == git("diff", "--cached", "--name-only").splitlines()
+    )
+
+
+def test_git_context_clean_repo(committed_repo):
+    """A clean tree reports no status and no changed files."""
+    context = get_git_context()
+
+    assert context["status"] == ""
+    assert context["uncommitted_changes"] == []
+    assert context["staged_changes"] == []
+
+
+def test_snapshot_index_update_keeps_permissions(tmp_path, monkeypatch):
+    """Rewriting the index keeps its mode instead of mkstemp's 0600."""
+    monkeypatch.chdir(tmp_path)
+    index_file = create_snapshot_directory() / "index.md"
+    index_file.chmod(0o644)
+
+    update_snapshot_index("s.md", "thing", "active")
+
+    assert "`s.md` - thing" in index_file.read_text()
+    assert index_file.stat().st_mode & 0o777 == 0o644
@@ -0,0 +1,80 @@
+"""
+Tests for AGOR file utilities.
+"""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from agor import utils
+
+
+class TestFastCopyFile:
+    """Test the copy_function used when building bundles."""
+
+    @pytest.fixture
+    def source(self, tmp_path):
+        src = tmp_path / "tool.sh"
+        src.write_text("#!/bin/sh\necho hi\n")
+        src.chmod(0o755)
+        os.utime(src, (1_000_000_000, 1_000_000_000))
+        return src
+
+    @pytest.mark.parametrize("sendfile_works", [True, False])
+    def test_copy_keeps_mode_and_mtime(self, source, tmp_path, sendfile_works):
+        """Test that a copy (not a hardlink) keeps exec bits and timestamps."""
+        dest = tmp_path / "copy.sh"
+        sendfile = os.sendfile if sendfile_works else OSError("unsupported")
+        with (
+            patch.object(utils.os, "link", side_effect=OSError("EXDEV")),
+            patch.object(utils, "_reflink", return_value=False),
+            patch.object(utils.os, "sendfile", side_effect=sendfile),
+        ):
+            utils.fast_copy_file(source, dest)
+
+        assert dest.read_text() == source.read_text()
+        assert dest.stat().st_mode & 0o777 == 0o755
+        assert dest.stat().st_mtime == 1_000_000_000
+        assert not os.path.samefile(source, dest)
+
+
+class TestReplaceAtomically:
+    """Test the temp-file-and-rename helper used for in-place rewrites."""
+
+    def test_keeps_existing_mode(self, tmp_path):
+        """Test that replacing a file keeps its permissions, not mkstemp's 0600."""
+        target = tmp_path / "index.md"
+        target.write_text("old")
+        target.chmod(0o644)
+
+        with utils.replace_atomically(target) as tmp:
+            tmp.write_text("new")
+
+        assert target.read_text() == "new"
+        assert target.stat().st_mode & 0o777 == 0o644
+
+    def test_new_file_gets_umask_mode(self, tmp_path):
+        """Test that a new file gets the permissions open() would give it."""
+        target = tmp_path / "new.txt"
+        umask = os.umask(0o022)
+        try:
+            with utils.replace_atomically(target) as tmp:
+                tmp.write_text("new")
+        finally:
+            os.umask(umask)
+
+        assert target.stat().st_mode & 0o777 == 0o644
+
+    def test_failure_leaves_target_and_no_temp_file(self, tmp_path):
+        """Test that an error inside the block keeps the old file untouched."""
+        target = tmp_path / "index.md"
+        target.write_text("old")
+
+        with pytest.raises(RuntimeError):
+            with utils.replace_atomically(target) as tmp:
+                tmp.write_text("partial")
+                raise RuntimeError("boom")
+
+        assert target.read_text() == "old"
+        assert list(tmp_path.iterdir()) == [target]